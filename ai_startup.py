@@ -0,0 +1,404 @@
+# ai_startup.py
+#
+# Memory-reclamation routine run when the AI (chatbot/LLM) mode is toggled
+# on. Loaded lazily by big_main.py on the first AI toggle so its imports and
+# tables stay off the cold-start path. Frees as much RAM as safely possible
+# before the ~2.9GB LLM is loaded: ensures swap exists, stops known-safe
+# memory hogs, drops kernel caches, and trims Python-side state.
+
+import gc
+import os
+import re
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+# Fire-and-forget subprocess calls discard their output into /dev/null
+# instead of capturing it: no pipe allocation, no UTF-8 decode of
+# text nobody reads. capture_output stays only where stdout is parsed.
+_DN = subprocess.DEVNULL
+
+# The sudo/systemctl calls that remain can't be avoided, but they can be
+# spawned with posix_spawn instead of fork+exec: forking this ~200MB Python
+# process duplicates page tables even though the child immediately execs.
+# All our calls use list argv with no preexec_fn, which is exactly the case
+# posix_spawn supports.
+if sys.platform.startswith('linux'):
+    subprocess._USE_POSIX_SPAWN = True
+
+# CRITICAL: processes that should NEVER be killed (essential system processes).
+# Compiled once into a single regex so classifying each process is one
+# C-level scan instead of ~40 Python substring tests.
+_PROTECTED_PROCESSES = frozenset({
+    'systemd', 'kthreadd', 'ksoftirqd', 'migration', 'rcu_', 'watchdog',
+    'sshd', 'ssh', 'NetworkManager', 'networkd', 'wpa_supplicant',
+    'dbus', 'dbus-daemon', 'systemd-', 'udev', 'rsyslog', 'cron',
+    'init', 'kernel', 'kworker', 'ksoftirq', 'rcu_gp', 'rcu_par_gp',
+    'wayvnc', 'vnc', 'tigervnc', 'x11vnc', 'vncserver',  # VNC servers - KEEP THESE!
+    'Xwayland', 'labwc', 'weston', 'sway', 'wayfire',  # Display servers - KEEP THESE!
+    'pulseaudio', 'pipewire', 'wireplumber',  # Audio systems
+    'gdm', 'lightdm', 'sddm', 'login',  # Login managers
+    'bash', 'zsh', 'fish', 'sh',  # Shells - keep active shells
+    'getty', 'agetty',  # TTY processes
+    'dhcpcd', 'dhclient',  # Network DHCP
+    'avahi-daemon'  # Network discovery (might be needed)
+})
+_PROTECTED_RE = re.compile('|'.join(re.escape(p) for p in sorted(_PROTECTED_PROCESSES)))
+
+# Safe to kill unconditionally: dev tools, browsers, Electron apps
+_KILLABLE_EXACT = frozenset({
+    'code', 'chrome', 'firefox', 'chromium', 'brave',
+    'electron', 'atom', 'slack', 'discord', 'docker', 'containerd'
+})
+_SNAP_RE = re.compile(r'^snap-|/snap/')
+
+# Python modules it is safe to evict from sys.modules (they re-import on
+# demand), and modules we must keep loaded. Precompiled so the sys.modules
+# sweep is one regex scan per module name.
+_SAFE_MOD_RE = re.compile(
+    r'numpy|matplotlib|pandas|scipy|sklearn|requests|urllib3|certifi|chardet'
+    r'|pil|pillow|json|xml|html|argparse|configparser|logging', re.IGNORECASE)
+_KEEP_MOD_RE = re.compile(r'face_gui|chatbot|camera|tkinter|cv2', re.IGNORECASE)
+
+
+def _write_sysctl(path, val):
+    """Write a /proc/sys value directly; fall back to sudo tee if not root.
+
+    A direct open/write is one syscall, versus fork+sudo+sh+echo per value
+    when shelled out. On the robot the app usually runs as root, so the
+    fallback is rarely taken.
+    """
+    try:
+        with open(path, 'w') as f:
+            f.write(f"{val}\n")
+    except PermissionError:
+        subprocess.run(['sudo', 'tee', path], input=f"{val}\n".encode(),
+                       check=False, stdout=_DN, stderr=_DN)
+    except OSError:
+        pass
+
+
+def read_meminfo():
+    """Parse /proc/meminfo into a dict of kB values.
+
+    One open/read instead of forking `free` and parsing its human-formatted
+    output - the memory-status checks during AI startup call this a lot.
+    """
+    info = {}
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                key, _, rest = line.partition(':')
+                parts = rest.split()
+                if parts:
+                    info[key] = int(parts[0])
+    except (OSError, ValueError):
+        pass
+    return info
+
+
+def _ensure_swap():
+    """Make sure swap exists before the LLM loads; create /swapfile if not."""
+    print("[MEMORY] Ensuring swap space is available for AI model...")
+    try:
+        # Fast path: if /swapfile is already listed in /proc/swaps it was
+        # set up (and made persistent) on a previous run - skip everything,
+        # including the fstab read.
+        try:
+            with open('/proc/swaps') as f:
+                if '/swapfile' in f.read():
+                    print("[MEMORY] /swapfile already active")
+                    return
+        except OSError:
+            pass
+
+        # Check current swap status (single /proc/meminfo read, no fork)
+        swap_total_kb = read_meminfo().get('SwapTotal', 0)
+        if swap_total_kb > 0:
+            print(f"[MEMORY] Swap already available: {swap_total_kb // 1024}MB")
+            return
+
+        # If no swap available, create it automatically
+        print("[MEMORY] No swap detected - creating 4GB swap file...")
+
+        # Create 4GB swap file if it doesn't exist
+        if not os.path.exists('/swapfile'):
+            print("[MEMORY] Creating swap file...")
+            subprocess.run(['sudo', 'fallocate', '-l', '4G', '/swapfile'],
+                           check=False, stdout=_DN, stderr=_DN)
+            subprocess.run(['sudo', 'chmod', '600', '/swapfile'],
+                           check=False, stdout=_DN, stderr=_DN)
+            subprocess.run(['sudo', 'mkswap', '/swapfile'],
+                           check=False, stdout=_DN, stderr=_DN)
+
+        # Activate swap
+        print("[MEMORY] Activating swap...")
+        subprocess.run(['sudo', 'swapon', '/swapfile'],
+                       check=False, stdout=_DN, stderr=_DN)
+
+        # Add to fstab if not already there
+        try:
+            with open('/etc/fstab', 'r') as f:
+                fstab_content = f.read()
+            if '/swapfile' not in fstab_content:
+                print("[MEMORY] Making swap permanent...")
+                subprocess.run(['sudo', 'sh', '-c', "echo '/swapfile none swap sw 0 0' >> /etc/fstab"],
+                               check=False, stdout=_DN, stderr=_DN)
+        except Exception:
+            pass
+
+        # Verify swap is now active
+        meminfo = read_meminfo()
+        print(f"[MEMORY] Swap after setup: {meminfo.get('SwapFree', 0) // 1024}MB "
+              f"free of {meminfo.get('SwapTotal', 0) // 1024}MB")
+
+    except Exception as e:
+        print(f"[MEMORY] Warning: Swap setup failed: {e}")
+        print("[MEMORY] Continuing without swap (may cause memory issues)")
+
+
+def _kill_memory_heavy_processes():
+    """Kill VS Code and other non-essential memory-heavy processes."""
+    try:
+        # Walk /proc ourselves instead of forking `ps` (which does the same
+        # walk, then sorts and formats text we immediately re-parse).
+        # RSS comes from field 2 of /proc/<pid>/statm, in pages.
+        page_kb = os.sysconf('SC_PAGE_SIZE') // 1024
+        total_kb = read_meminfo().get('MemTotal', 0)
+        if total_kb > 0:
+            processes_to_kill = []
+            current_python_pid = os.getpid()  # Don't kill our own process
+
+            killed_count = 0
+            for pid in os.listdir('/proc'):
+                if not pid.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{pid}/statm') as f:
+                        rss_pages = int(f.read().split()[1])
+                    with open(f'/proc/{pid}/comm') as f:
+                        comm = f.read().strip()
+                except (OSError, IndexError, ValueError):
+                    continue  # Process exited mid-walk
+
+                mem_val = rss_pages * page_kb / total_kb * 100
+                comm_lower = comm.lower()
+
+                # Skip our own Python process
+                if int(pid) == current_python_pid:
+                    continue
+
+                # Skip protected processes (NEVER kill these) -
+                # single compiled-regex scan over the name
+                if _PROTECTED_RE.search(comm_lower):
+                    continue
+
+                # Target ONLY specific safe memory-consuming processes:
+                # dev tools / browsers / Electron / Docker (exact set),
+                # snap apps, Jupyter, and big python3/ollama instances
+                should_kill = (
+                    comm in _KILLABLE_EXACT
+                    or _SNAP_RE.search(comm) is not None
+                    or 'jupyter' in comm_lower
+                    # Higher memory threshold for python3; Ollama restarts later
+                    or (comm == 'python3' and mem_val > 5.0)
+                    or (comm == 'ollama' and mem_val > 3.0)
+                )
+
+                if should_kill:
+                    processes_to_kill.append(int(pid))
+
+            # Batch signal: SIGTERM everything, one grace sleep total,
+            # then SIGKILL only the survivors. Avoids two sudo
+            # fork/execs plus a 100 ms sleep per victim.
+            for pid_num in processes_to_kill:
+                try:
+                    os.kill(pid_num, signal.SIGTERM)
+                    killed_count += 1
+                except (ProcessLookupError, PermissionError):
+                    pass
+            if processes_to_kill:
+                time.sleep(0.1)
+                for pid_num in processes_to_kill:
+                    if os.path.exists(f'/proc/{pid_num}'):
+                        try:
+                            os.kill(pid_num, signal.SIGKILL)
+                        except (ProcessLookupError, PermissionError):
+                            pass
+
+            if killed_count > 0:
+                print(f"[MEMORY] Stopped {killed_count} memory-heavy processes")
+
+        # Also try to stop VS Code service if it exists
+        try:
+            subprocess.run(['sudo', 'systemctl', 'stop', 'code'], check=False, stdout=_DN, stderr=_DN)
+            subprocess.run(['sudo', 'systemctl', 'disable', 'code'], check=False, stdout=_DN, stderr=_DN)
+        except Exception:
+            pass
+
+    except Exception as e:
+        print(f"[MEMORY] Process optimization: {e}")
+
+
+def _stop_nonessential_services():
+    """Stop only non-essential services (NOT NetworkManager!)."""
+    safe_services_to_stop = [
+        #'bluetooth',  # Bluetooth - safe to stop temporarily
+        'cups',  # Printing service - safe to stop
+    ]
+
+    stopped_services = 0
+    for service in safe_services_to_stop:
+        try:
+            # Check if service is active first
+            result = subprocess.run(['systemctl', 'is-active', service],
+                                    capture_output=True, text=True)
+            if result.returncode == 0 and 'active' in result.stdout:
+                subprocess.run(['sudo', 'systemctl', 'stop', service],
+                               check=False, stdout=_DN, stderr=_DN)
+                stopped_services += 1
+        except Exception:
+            pass
+
+    if stopped_services > 0:
+        print(f"[MEMORY] Stopped {stopped_services} non-essential services")
+
+
+def _unload_safe_modules():
+    """Evict re-importable heavy modules from sys.modules (single pass)."""
+    try:
+        unloaded_count = 0
+        for module_name in list(sys.modules.keys()):
+            if _SAFE_MOD_RE.search(module_name) and not _KEEP_MOD_RE.search(module_name):
+                try:
+                    del sys.modules[module_name]
+                    unloaded_count += 1
+                except KeyError:
+                    pass
+                if unloaded_count >= 10:  # Limit to first 10
+                    break
+
+        if unloaded_count > 0:
+            print(f"[MEMORY] Unloaded {unloaded_count} unused modules")
+
+    except Exception:
+        pass
+
+
+def _trim_gui(face_app, root):
+    """Clear non-essential canvas items and let Tk flush its queues."""
+    try:
+        if hasattr(face_app, 'canvas') and face_app.canvas:
+            try:
+                items = face_app.canvas.find_all()
+                if len(items) > 20:
+                    # Face parts and game images carry tags; the starfield
+                    # ovals are untagged. A couple of find_withtag calls and
+                    # a set difference replace one gettags Tcl round-trip
+                    # per canvas item.
+                    to_clear = set(face_app.canvas.find_withtag('face_part'))
+                    to_clear |= set(face_app.canvas.find_withtag('game_image'))
+                    to_clear -= set(face_app.canvas.find_withtag('star'))
+
+                    for item in to_clear:
+                        face_app.canvas.delete(item)
+
+                    if to_clear:
+                        print(f"[MEMORY] Cleaned {len(to_clear)} canvas items, preserved stars")
+            except Exception:
+                pass
+
+        # Temporary window withdrawal
+        root.withdraw()
+        root.update_idletasks()
+
+        # Light GUI cleanup
+        root.tk.call('update')
+        gc.collect()
+
+    except Exception:
+        pass
+
+
+def _trim_gui_from_worker(face_app, root, timeout=2.0):
+    """Schedule _trim_gui on the Tk main thread and wait for it to finish.
+
+    reclaim_memory_for_ai runs on a worker thread, but canvas/window calls
+    must happen on the thread that owns the Tk interpreter.
+    """
+    done = threading.Event()
+
+    def _on_gui():
+        try:
+            _trim_gui(face_app, root)
+        finally:
+            done.set()
+
+    try:
+        root.after(0, _on_gui)
+        done.wait(timeout)
+    except Exception:
+        pass
+
+
+def reclaim_memory_for_ai(face_app, root):
+    """Free as much memory as safely possible before loading the LLM."""
+    print("[AI] Freeing up system memory for AI...")
+
+    # STEP 1: Ensure swap space is available for AI model loading
+    _ensure_swap()
+
+    # STEP 2: Free up system memory before starting AI
+    try:
+        # Show memory before cleanup
+        print("[MEMORY] Optimizing system memory...")
+        print(f"[MEMORY] Available before cleanup: {read_meminfo().get('MemAvailable', 0) // 1024}MB")
+
+        _kill_memory_heavy_processes()
+        _stop_nonessential_services()
+
+        # Python garbage collection - run BEFORE the cache drop so the
+        # kernel sweep sees the pages Python just released. One collect()
+        # already walks all three generations; a second pass only pays off
+        # after a genuinely large free.
+        collected = gc.collect()
+        if collected > 0:
+            print(f"[MEMORY] Garbage collection freed {collected} objects")
+        if collected > 100:
+            gc.collect()
+
+        # Additional memory optimizations
+        # (the single sync + drop_caches pass happens at the end, once all
+        # kills and trims have actually released their pages)
+        try:
+            _write_sysctl('/proc/sys/vm/compact_memory', 1)
+            subprocess.run(['sudo', 'swapoff', '-a'], check=False, stdout=_DN, stderr=_DN)
+            time.sleep(0.5)
+            subprocess.run(['sudo', 'swapon', '-a'], check=False, stdout=_DN, stderr=_DN)
+        except Exception:
+            pass
+
+        # Smart Python module management
+        _unload_safe_modules()
+
+        # Smart GUI cleanup (marshalled onto the Tk thread)
+        _trim_gui_from_worker(face_app, root)
+
+        # Conservative system tuning
+        try:
+            _write_sysctl('/proc/sys/vm/vfs_cache_pressure', 60)
+            _write_sysctl('/proc/sys/vm/swappiness', 8)
+            os.sync()  # Single libc call, no sudo fork
+            _write_sysctl('/proc/sys/vm/drop_caches', 3)
+        except Exception:
+            pass
+
+        # Show final memory
+        print(f"[MEMORY] Available after cleanup: {read_meminfo().get('MemAvailable', 0) // 1024}MB")
+
+        time.sleep(0.5)  # Brief stabilization
+
+    except Exception as e:
+        print(f"[AI] Memory optimization warning: {e}")
@@ -12,31 +12,168 @@ Unified entry point for:
 Customize IR button codes in the CONFIG SECTION below.
 """
 
+# Keep annotations lazily evaluated (strings) - nothing here ever calls
+# get_type_hints, so the typing machinery never needs to be imported.
+from __future__ import annotations
+
+import functools
+import gc
+import glob
+import importlib
 import os
+import signal
+import site
 import sys
 import threading
 import time
 import tkinter as tk
 import traceback
-from typing import Optional
+from enum import IntEnum, unique
 
 # Ensure CameraLib (and sibling loose modules) are importable even if their
 # internal files use bare imports like `import color_tracking_lib`.
+# site.addsitedir dedups internally (no linear sys.path scan) and also
+# processes any .pth files shipped inside CameraLib.
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 CAMERA_LIB_PATH = os.path.join(BASE_DIR, "CameraLib")
-if CAMERA_LIB_PATH not in sys.path:
-    sys.path.insert(0, CAMERA_LIB_PATH)
+site.addsitedir(CAMERA_LIB_PATH)
 
 # Existing modules
+# The face GUI is the always-on surface, so it (and the hardware layer needed
+# for the IR receiver) stay eager. Everything else - chatbot (Vosk/Ollama),
+# CameraMaster (OpenCV/TF), RPS and presentation - is heavy and only needed
+# once its mode is actually triggered, so those are imported lazily below.
+import stop_registry
 from face_gui import MarichFaceApp, Config  # type: ignore
-from chatbot_logic import run_chatbot, request_stop  # type: ignore
-from CameraLib.camera_master_lib import CameraMaster  # type: ignore
 from Raspbot_Lib import Raspbot  # type: ignore
 # MODIFIED: Added trigger_beep
 from robot_hardware import set_emotion_led, turn_off_led, stop as motor_stop, trigger_beep  # type: ignore
-from rock_paper_scissors import run_rps_game, request_stop as rps_request_stop  # type: ignore
-# --- NEW: Import presentation sequence ---
-from presentation_sequence import run_presentation, request_stop as pres_request_stop # type: ignore
+
+# --- NEW: Lazy import helper ---
+# Heavy modules are imported on first use and cached, so cold start and
+# resident memory only pay for the modes the user actually selects.
+_LAZY_MODULES: dict = {}
+
+def _lazy(name):
+    """Import a heavy module on first use and cache it for later calls."""
+    mod = _LAZY_MODULES.get(name)
+    if mod is None:
+        mod = importlib.import_module(name)
+        _LAZY_MODULES[name] = mod
+    return mod
+# --- END NEW ---
+
+# --- NEW: Thread placement helpers ---
+# On the quad-core Pi the scheduler migrates our threads between cores and
+# trashes the caches. Best effort: keep Tk/IR/chatbot on cores 0-1 and the
+# camera-driven threads on cores 2-3. No-ops on platforms without
+# sched_setaffinity or with fewer cores.
+GUI_CPUS = {0, 1}
+CAMERA_CPUS = {2, 3}
+
+def _run_with_affinity(fn, cpu_mask, *args, nice_inc=0, **kwargs):
+    """Thread entrypoint wrapper: pin to `cpu_mask` (Linux, best effort),
+    optionally lower scheduling priority, then run `fn`."""
+    try:
+        os.sched_setaffinity(0, cpu_mask & set(range(os.cpu_count() or 1)))
+    except (AttributeError, OSError, TypeError):
+        pass
+    if nice_inc:
+        try:
+            os.nice(nice_inc)
+        except OSError:
+            pass
+    fn(*args, **kwargs)
+# --- END NEW ---
+
+
+# --- NEW: Video device helpers ---
+@functools.lru_cache(maxsize=1)
+def _video_devices():
+    """Existing /dev/video* nodes, enumerated once per session."""
+    return tuple(glob.glob('/dev/video*')) or ('/dev/video0', '/dev/video1')
+
+
+def _video_users(dev):
+    """PIDs (other than our own) holding `dev` open.
+
+    Scans /proc/<pid>/fd symlinks directly instead of forking `fuser`,
+    which does the same walk plus text formatting we'd immediately
+    re-parse. Processes that exit mid-scan are skipped.
+    """
+    users = []
+    self_pid = str(os.getpid())
+    try:
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit() or pid == self_pid:
+                continue
+            fd_dir = f'/proc/{pid}/fd'
+            try:
+                for fd in os.listdir(fd_dir):
+                    if os.readlink(f'{fd_dir}/{fd}') == dev:
+                        users.append(int(pid))
+                        break
+            except OSError:
+                continue  # No permission or process exited
+    except OSError:
+        pass
+    return users
+
+
+def _kill_video_users(dev):
+    """SIGKILL every process holding `dev` open; returns True if any."""
+    users = _video_users(dev)
+    for pid in users:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    return bool(users)
+# --- END NEW ---
+
+
+# --- NEW: Background mode controller ---
+class ModeController:
+    """Owns the thread / stop-event pair for one background mode.
+
+    Replaces the started-flag / thread / stop-event attribute triples that
+    used to be copy-pasted for chatbot, RPS, and presentation (and
+    occasionally left half-reset on a failed stop).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.thread = None
+        self.stop_event = None
+
+    @property
+    def started(self):
+        return self.thread is not None
+
+    def start(self, make_thread):
+        """Launch the mode. make_thread(stop_event) returns an unstarted Thread."""
+        if self.thread is not None:
+            return False
+        self.stop_event = threading.Event()
+        self.thread = make_thread(self.stop_event)
+        self.thread.start()
+        return True
+
+    def signal_stop(self):
+        """Set the stop event without waiting (broadcast phase)."""
+        if self.stop_event is not None:
+            self.stop_event.set()
+
+    def stop(self, join_fn):
+        """Signal and join; clears state only if join_fn reports a clean exit."""
+        if self.thread is None:
+            return True
+        self.signal_stop()
+        if join_fn(self.thread, self.name):
+            self.thread = None
+            self.stop_event = None
+            return True
+        return False
 # --- END NEW ---
 
 
@@ -44,45 +181,74 @@ from presentation_sequence import run_presentation, request_stop as pres_request
 
 # IR address register already used: read_data_array(0x0c,1)
 # Assign HEX codes matching your remote.
-IR_COLOR_RED = 0x01
-IR_COLOR_BLUE = 0x04
-IR_COLOR_GREEN = 0x06
-IR_COLOR_YELLOW = 0x09
-IR_FACE_MODE = 0x10
-IR_GESTURE_MODE = 0x11
-IR_OBJECT_MODE = 0x12
-IR_PLATE_MODE = 0x14
-IR_RPS_GAME = 0x19  # Rock Paper Scissors game mode
-IR_PRESENTATION = 0x15 # --- NEW: Presentation Mode button ---
-IR_AI_TOGGLE = 0x02  # Toggle AI (voice/chatbot) on/off
-IR_STOP_ALL = 0x05  # Stop all camera modes + motors
-IR_EXIT_APP = 0x00  # Exit whole application (remapped from 0x1A)
+# Grouped in an IntEnum so an accidental duplicate assignment raises at
+# import time instead of silently shadowing another button (@unique is
+# what raises - a plain IntEnum would treat the duplicate as an alias).
+@unique
+class IRCode(IntEnum):
+    COLOR_RED = 0x01
+    COLOR_BLUE = 0x04
+    COLOR_GREEN = 0x06
+    COLOR_YELLOW = 0x09
+    FACE_MODE = 0x10
+    GESTURE_MODE = 0x11
+    OBJECT_MODE = 0x12
+    PLATE_MODE = 0x14
+    RPS_GAME = 0x19  # Rock Paper Scissors game mode
+    PRESENTATION = 0x15  # --- NEW: Presentation Mode button ---
+    AI_TOGGLE = 0x02  # Toggle AI (voice/chatbot) on/off
+    STOP_ALL = 0x05  # Stop all camera modes + motors
+    EXIT_APP = 0x00  # Exit whole application (remapped from 0x1A)
+
+# Module-level aliases kept for backward compatibility
+IR_COLOR_RED = IRCode.COLOR_RED
+IR_COLOR_BLUE = IRCode.COLOR_BLUE
+IR_COLOR_GREEN = IRCode.COLOR_GREEN
+IR_COLOR_YELLOW = IRCode.COLOR_YELLOW
+IR_FACE_MODE = IRCode.FACE_MODE
+IR_GESTURE_MODE = IRCode.GESTURE_MODE
+IR_OBJECT_MODE = IRCode.OBJECT_MODE
+IR_PLATE_MODE = IRCode.PLATE_MODE
+IR_RPS_GAME = IRCode.RPS_GAME
+IR_PRESENTATION = IRCode.PRESENTATION
+IR_AI_TOGGLE = IRCode.AI_TOGGLE
+IR_STOP_ALL = IRCode.STOP_ALL
+IR_EXIT_APP = IRCode.EXIT_APP
 
 # Optional: debounce (seconds) to ignore repeated same code too fast
 IR_DEBOUNCE_SEC = 0.4
 IR_DEBUG = False  # Set True to log every non-zero IR code for mapping
+DEBUG_MEM = False  # Set True to force a full GC sweep on camera release
+
+# Raspbot WQ2812 LED color codes (Red:0, Green:1, Blue:2, Yellow:3; 6 = white
+# fallback). Module-level so _start_color_mode doesn't rebuild the dict on
+# every IR press.
+_LED_COLOR_INDEX = {'red': 0, 'green': 1, 'blue': 2, 'yellow': 3}
 
 
 # ======================================================================
 
 class BigMainApp:
+    # Every CameraMaster stop method, with a log label. Camera teardown
+    # iterates this instead of five copy-pasted try/except blocks; adding a
+    # mode is a one-line change.
+    _CAMERA_STOP_METHODS = (
+        ('stop_color_tracking', 'Color tracker'),
+        ('stop_face_tracking', 'Face tracker'),
+        ('stop_gesture_following', 'Gesture tracker'),
+        ('stop_object_recognition', 'Object recognition'),
+        ('stop_license_plate_recognition', 'License plate recognition'),
+    )
+
     def __init__(self):
         """Initialize lightweight shell; defer heavy subsystems until first IR command."""
         # Tk root & Face GUI (but don't start animation loops yet)
         self.root = tk.Tk()
 
-        # --- FIX 1: Startup Crash ---
-        # The MarichFaceApp __init__ in face_gui.py only takes `root` as an argument.
-        # Passing width and height here was causing a TypeError on startup.
-        # self.face_app = MarichFaceApp(self.root, Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT)
-        self.face_app = MarichFaceApp(self.root)
-        # --- END FIX 1 ---
-
-        # Hide the face GUI at startup - only show when AI is enabled
-        try:
-            self.face_app.suspend()
-        except Exception:
-            pass
+        # Face GUI is constructed lazily on first access (see the face_app
+        # property) - the default state is AI off with the face hidden, so
+        # building all the canvas widgets at boot was wasted work.
+        self._face_app = None
 
         # Camera manager (lazy). Create on first mode activation.
         self.camera = None  # type: Optional[CameraMaster]
@@ -92,6 +258,11 @@ class BigMainApp:
         # Animation lazy flag
         self._animations_started = False
 
+        # Adaptive frame pacing: the display loop schedules itself at
+        # (frame budget - measured work) instead of a fixed 50 ms
+        # regardless of load.
+        self._target_fps = 20
+
         # Hardware (IR + servos + motors)
         self.bot = Raspbot()
         self.bot.Ctrl_IR_Switch(1)  # Enable IR receiver
@@ -100,23 +271,59 @@ class BigMainApp:
         self.active_mode = None  # 'color','face','gesture','object','plate','rps','presentation'
         self.active_color = None  # Current color when in color mode
         self.ai_enabled = False  # Start with AI OFF; toggle via IR
-        self.chatbot_thread = None
-        self._chatbot_stop_event = None
-        self._chatbot_started = False
-        self.rps_thread = None  # Rock Paper Scissors game thread
-        self._rps_stop_event = None
-        self._rps_started = False
-        
-        # --- NEW: Presentation state ---
-        self.presentation_thread = None
-        self._presentation_stop_event = None
-        self._presentation_started = False
-        # --- END NEW ---
+        # Thread/stop-event state for each background mode
+        self._chatbot = ModeController("Chatbot")
+        self._rps = ModeController("RPS game")
+        self._presentation = ModeController("Presentation")
         
         self._stop_flag = threading.Event()
         self._ir_thread = None
+        self._cam_thread = None  # Camera display thread (started lazily)
+        # Pending root.after ids (see _schedule) so shutdown can cancel
+        # them instead of racing destroyed widgets
+        self._after_ids = set()
         self._last_ir_code = 0
         self._last_ir_time = 0.0
+        # Per-code debounce timestamps (replaces the single last-code pair
+        # for debouncing, so alternating buttons don't defeat the debounce)
+        self._ir_last_times = {}  # type: dict
+
+        # --- NEW: Precomputed IR dispatch table ---
+        # Built once here instead of scanning a long if/elif ladder on every
+        # remote press: one dict lookup per IR event.
+        self._ir_dispatch = {
+            IR_COLOR_RED: lambda: self._start_color_mode('red'),
+            IR_COLOR_BLUE: lambda: self._start_color_mode('blue'),
+            IR_COLOR_GREEN: lambda: self._start_color_mode('green'),
+            IR_COLOR_YELLOW: lambda: self._start_color_mode('yellow'),
+            IR_FACE_MODE: self._start_face_mode,
+            IR_GESTURE_MODE: self._start_gesture_mode,
+            IR_OBJECT_MODE: self._start_object_mode,
+            IR_PLATE_MODE: self._start_plate_mode,
+            IR_RPS_GAME: lambda: self._schedule(0, self._start_rps_if_needed),
+            IR_PRESENTATION: lambda: self._schedule(0, self._start_presentation_mode),
+            IR_AI_TOGGLE: lambda: self._schedule(0, self._toggle_ai),
+            IR_STOP_ALL: lambda: self._schedule(10, self._release_camera_completely),
+            IR_EXIT_APP: self._on_ir_exit,
+        }
+        # --- END NEW ---
+
+        # Object/plate mode asset paths, resolved and stat()ed once - they
+        # never change across a session, so mode entry skips the filesystem
+        _obj_dir = os.path.join(BASE_DIR, 'CameraLib', '04.Tensorflow_object_recognition')
+        self._object_model_path = os.path.join(
+            _obj_dir, 'ssdlite_mobilenet_v2_coco_2018_05_09', 'frozen_inference_graph.pb')
+        self._object_labels_path = os.path.join(_obj_dir, 'data', 'mscoco_label_map.pbtxt')
+        self._object_assets_ok = (os.path.exists(self._object_model_path)
+                                  and os.path.exists(self._object_labels_path))
+        self._plate_font_path = '07.Camera-Based_License_plate_recognition/platech.ttf'
+        # Optional quantized TFLite variant of the object model (produced
+        # once with tflite_convert at install time). Loaded lazily into a
+        # persistent interpreter so re-entering object mode doesn't re-read
+        # the ~20MB graph from the SD card.
+        self._object_tflite_path = os.path.join(
+            _obj_dir, 'ssdlite_mobilenet_v2_coco_2018_05_09', 'ssdlite.tflite')
+        self._tflite_obj = None
 
         # Chatbot not started yet (lazy on IR toggle)
 
@@ -124,40 +331,102 @@ class BigMainApp:
         self._ir_thread = threading.Thread(target=self._ir_loop, daemon=True)
         self._ir_thread.start()
 
-        # Periodic camera frame display loop (will be idle until camera created)
-        self.root.after(200, self._camera_ui_loop)
+        # Camera frame display loop is event-driven: it is kicked off by
+        # _ensure_camera when a camera mode starts, and stops itself when
+        # the camera goes away. Nothing is scheduled while idle.
 
         print("BigMainApp initialized. Idle (no camera, no animations, AI off). Awaiting IR commands...")
         self._print_help()
 
+    @property
+    def face_app(self):
+        """Construct the face GUI on first access and keep it suspended.
+
+        --- FIX 1 (kept from the eager version): MarichFaceApp only takes
+        `root`; passing width/height caused a TypeError on startup. ---
+        """
+        if self._face_app is None:
+            self._face_app = MarichFaceApp(self.root)
+            # Hide the face GUI until a mode actually shows it
+            try:
+                self._face_app.suspend()
+            except Exception:
+                pass
+        return self._face_app
+
+    # --------------- Tk Scheduling Helper ---------------
+    def _schedule(self, delay_ms, fn):
+        """root.after wrapper that tracks the pending id.
+
+        shutdown() cancels every tracked id before destroying the root, so
+        late callbacks never fire against dead widgets ('invalid command
+        name' spam on slow quit paths). Callbacks self-remove on firing.
+        """
+        aid = None
+
+        def _run():
+            self._after_ids.discard(aid)
+            fn()
+
+        aid = self.root.after(delay_ms, _run)
+        self._after_ids.add(aid)
+        return aid
+
+    # --------------- Thread Join Helper ---------------
+    @staticmethod
+    def _safe_join(thread, label, short=2.0, long=5.0):
+        """Join a worker thread with escalation; True if it actually exited.
+
+        A bare join(timeout) silently ignores a stuck thread - callers must
+        only clear their started/thread/event state when this returns True,
+        otherwise a still-alive thread would leak behind a fresh restart.
+        """
+        if thread is None:
+            return True
+        thread.join(short)
+        if thread.is_alive():
+            print(f"[SYS] {label} thread still running after {short}s, waiting up to {long}s more...")
+            thread.join(long)
+            if thread.is_alive():
+                print(f"[SYS] WARNING: {label} thread did not exit; keeping its state.")
+                return False
+        return True
+
+    # --------------- Stop Broadcast ---------------
+    def _signal_all_stops(self):
+        """Set every active mode's stop event up front (single broadcast).
+
+        The per-mode stop helpers each do a blocking join; signalling all
+        events first means no mode keeps running while an earlier mode's
+        join is still waiting. The registry broadcast also reaches any
+        mode thread that registered a stopper we don't track here.
+        """
+        for mode in (self._chatbot, self._rps, self._presentation):
+            mode.signal_stop()
+        stop_registry.stop_all()
+
     # --------------- Chatbot Control ---------------
     def _start_chatbot_if_needed(self, suppress_greeting: bool = False):
-        if self.ai_enabled and not self._chatbot_started:
-            from threading import Event
-            self._chatbot_stop_event = Event()
-            self.chatbot_thread = threading.Thread(
-                target=run_chatbot,
-                args=(self.face_app, self._chatbot_stop_event, suppress_greeting),
+        if self.ai_enabled and not self._chatbot.started:
+            self._chatbot.start(lambda stop_event: threading.Thread(
+                target=_run_with_affinity,
+                args=(_lazy("chatbot_logic").run_chatbot, GUI_CPUS,
+                      self.face_app, stop_event, suppress_greeting),
+                kwargs={"nice_inc": 5},  # LLM work yields to GUI/camera
                 daemon=True,
                 name="ChatbotThread"
-            )
-            self.chatbot_thread.start()
-            self._chatbot_started = True
+            ))
             print("[AI] Chatbot thread launched.")
         elif not self.ai_enabled:
             print("[AI] Chatbot remains disabled.")
 
     def _stop_chatbot_if_running(self):
-        if self._chatbot_started and self._chatbot_stop_event:
+        if self._chatbot.started:
             print("[AI] Stopping chatbot thread...")
-            request_stop(self._chatbot_stop_event)
-            # Give it a short grace period
-            if self.chatbot_thread:
-                self.chatbot_thread.join(timeout=2.0)
-            self._chatbot_started = False
-            self.chatbot_thread = None
-            self._chatbot_stop_event = None
-            print("[AI] Chatbot stopped.")
+            stop_registry.stop("chatbot")
+            # Only clears state once the thread has really exited
+            if self._chatbot.stop(self._safe_join):
+                print("[AI] Chatbot stopped.")
 
     # --------------- RPS Game Control ---------------
     def _start_rps_if_needed(self):
@@ -165,12 +434,12 @@ class BigMainApp:
 
         # --- FIX 2: AI vs RPS Conflict ---
         # Prevent starting RPS if AI mode is active.
-        if self.ai_enabled or self._presentation_started: # MODIFIED: Also check presentation
+        if self.ai_enabled or self._presentation.started: # MODIFIED: Also check presentation
             print("[MODE] Cannot start RPS game while AI or Presentation is enabled. Disable AI first.")
             return
         # --- END FIX 2 ---
 
-        if not self._rps_started:
+        if not self._rps.started:
             # Stop any other modes first
             self._stop_all_camera_modes()
 
@@ -204,41 +473,34 @@ class BigMainApp:
                 print(f"[RPS] Could not resume face GUI: {e}")
             # --- END FIX 3 ---
 
-            from threading import Event
-            self._rps_stop_event = Event()
-            self.rps_thread = threading.Thread(
-                target=run_rps_game,
-                args=(self.face_app, self.camera, self._rps_stop_event),
+            self._rps.start(lambda stop_event: threading.Thread(
+                target=_run_with_affinity,
+                args=(_lazy("rock_paper_scissors").run_rps_game, CAMERA_CPUS,
+                      self.face_app, self.camera, stop_event),
                 daemon=True,
                 name="RPSGameThread"
-            )
-            self.rps_thread.start()
-            self._rps_started = True
+            ))
             self.active_mode = 'rps'
             print("[RPS] Rock Paper Scissors game thread launched.")
 
     def _stop_rps_if_running(self):
         """Stop the Rock Paper Scissors game if running."""
-        if self._rps_started and self._rps_stop_event:
+        if self._rps.started:
             print("[RPS] Stopping Rock Paper Scissors game...")
-            rps_request_stop(self._rps_stop_event)
-            # Give it a short grace period
-            if self.rps_thread:
-                self.rps_thread.join(timeout=2.0)
-            self._rps_started = False
-            self.rps_thread = None
-            self._rps_stop_event = None
-            if self.active_mode == 'rps' or self.active_mode == 'gesture':
-                self.active_mode = None
-            print("[RPS] Rock Paper Scissors game stopped.")
+            stop_registry.stop("rps")
+            # Only clears state once the thread has really exited
+            if self._rps.stop(self._safe_join):
+                if self.active_mode == 'rps' or self.active_mode == 'gesture':
+                    self.active_mode = None
+                print("[RPS] Rock Paper Scissors game stopped.")
 
     # --- NEW: Presentation Mode Control ---
     def _start_presentation_mode(self):
         """Starts the Marich self-introduction sequence."""
-        if self.ai_enabled or self._rps_started:
+        if self.ai_enabled or self._rps.started:
             print("[MODE] Cannot start presentation while AI or RPS is active.")
             return
-        if self._presentation_started:
+        if self._presentation.started:
             print("[MODE] Presentation already running.")
             return
 
@@ -252,33 +514,26 @@ class BigMainApp:
         except Exception as e:
             print(f"[Presentation] Could not resume face GUI: {e}")
 
-        from threading import Event
-        self._presentation_stop_event = Event()
-        self.presentation_thread = threading.Thread(
-            target=run_presentation,
+        self._presentation.start(lambda stop_event: threading.Thread(
+            target=_lazy("presentation_sequence").run_presentation,
             # Pass the app, bot, and stop event
-            args=(self.face_app, self.bot, self._presentation_stop_event),
+            args=(self.face_app, self.bot, stop_event),
             daemon=True,
             name="PresentationThread"
-        )
-        self.presentation_thread.start()
-        self._presentation_started = True
+        ))
         self.active_mode = 'presentation' # Set new active mode
         print("[Presentation] Presentation thread launched.")
 
     def _stop_presentation_if_running(self):
         """Stops the presentation sequence if it is running."""
-        if self._presentation_started and self._presentation_stop_event:
+        if self._presentation.started:
             print("[Presentation] Stopping presentation...")
-            pres_request_stop(self._presentation_stop_event)
-            if self.presentation_thread:
-                self.presentation_thread.join(timeout=2.0) # Wait for thread to cleanup
-            self._presentation_started = False
-            self.presentation_thread = None
-            self._presentation_stop_event = None
-            if self.active_mode == 'presentation':
-                self.active_mode = None
-            print("[Presentation] Presentation stopped.")
+            _lazy("presentation_sequence").request_stop(self._presentation.stop_event)
+            # Only clears state once the thread has really exited
+            if self._presentation.stop(self._safe_join):
+                if self.active_mode == 'presentation':
+                    self.active_mode = None
+                print("[Presentation] Presentation stopped.")
     # --- END NEW ---
 
     def _toggle_ai(self):
@@ -286,20 +541,26 @@ class BigMainApp:
         if self.ai_enabled:
             print("[AI] Enabling AI - releasing camera if active and starting face/chatbot...")
             # Stop RPS game if it's running
-            if self._rps_started:
+            if self._rps.started:
                 self._stop_rps_if_running()
             # --- NEW: Stop presentation if it's running ---
-            if self._presentation_started:
+            if self._presentation.started:
                 self._stop_presentation_if_running()
             # --- END NEW ---
                 
             # Only release camera if it's actually running - AI and camera are mutually exclusive
             if self.camera is not None or self._camera_initialized:
                 # Schedule camera release on main thread to avoid Qt threading issues
-                self.root.after(10, self._release_camera_completely)
+                self._schedule(10, self._release_camera_completely)
             else:
-                # No camera to release, proceed directly
-                self._start_ai_components()
+                # No camera to release, proceed directly - on a worker
+                # thread so the multi-second reclamation/preload doesn't
+                # freeze the Tk event loop. face_app is resolved here in
+                # the args tuple, on the Tk thread, so a first toggle
+                # never constructs the Tk widgets on the worker.
+                threading.Thread(target=self._start_ai_components,
+                                 args=(self.face_app,),
+                                 daemon=True, name="AIStartupThread").start()
         else:
             print("[AI] Disabling AI - stopping face/chatbot only...")
             self._stop_chatbot_if_running()
@@ -313,361 +574,60 @@ class BigMainApp:
             turn_off_led()
             # --- END QoL SUGGESTION ---
 
-    def _start_ai_components(self):
-        """Start AI components after camera has been released"""
-        print("[AI] Freeing up system memory for AI...")
-
-        # Import subprocess at the beginning
-        import subprocess
-
-        # STEP 1: Ensure swap space is available for AI model loading
-        print("[MEMORY] Ensuring swap space is available for AI model...")
-        try:
-            # Check current swap status
-            result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-            swap_available = False
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if line.startswith('Swap:'):
-                        parts = line.split()
-                        if len(parts) >= 2 and parts[1] != '0B':
-                            swap_available = True
-                            print(f"[MEMORY] Swap already available: {parts[1]}")
-                            break
-
-            # If no swap available, create it automatically
-            if not swap_available:
-                print("[MEMORY] No swap detected - creating 4GB swap file...")
-
-                # Create 4GB swap file if it doesn't exist
-                if not os.path.exists('/swapfile'):
-                    print("[MEMORY] Creating swap file...")
-                    subprocess.run(['sudo', 'fallocate', '-l', '4G', '/swapfile'],
-                                   check=False, capture_output=True)
-                    subprocess.run(['sudo', 'chmod', '600', '/swapfile'],
-                                   check=False, capture_output=True)
-                    subprocess.run(['sudo', 'mkswap', '/swapfile'],
-                                   check=False, capture_output=True)
-
-                # Activate swap
-                print("[MEMORY] Activating swap...")
-                subprocess.run(['sudo', 'swapon', '/swapfile'],
-                               check=False, capture_output=True)
-
-                # Add to fstab if not already there
-                try:
-                    with open('/etc/fstab', 'r') as f:
-                        fstab_content = f.read()
-                    if '/swapfile' not in fstab_content:
-                        print("[MEMORY] Making swap permanent...")
-                        subprocess.run(['sudo', 'sh', '-c', "echo '/swapfile none swap sw 0 0' >> /etc/fstab"],
-                                       check=False, capture_output=True)
-                except Exception:
-                    pass
-
-                # Verify swap is now active
-                result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print("[MEMORY] Swap status after setup:")
-                    print(result.stdout)
-
-        except Exception as e:
-            print(f"[MEMORY] Warning: Swap setup failed: {e}")
-            print("[MEMORY] Continuing without swap (may cause memory issues)")
-
-        # STEP 2: Free up system memory before starting AI
-        try:
-            import subprocess
-
-            # Show memory before cleanup
-            print("[MEMORY] Optimizing system memory...")
-            result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) >= 2:
-                    mem_line = lines[1].split()
-                    if len(mem_line) >= 7:
-                        print(f"[MEMORY] Available before cleanup: {mem_line[6]}")
-
-            # Kill VS Code and other non-essential memory-heavy processes
-            try:
-                # Get all processes and find memory-heavy instances
-                result = subprocess.run(['ps', '-eo', 'pid,comm,%mem', '--sort=-%mem', '--no-headers'],
-                                        capture_output=True, text=True)
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    processes_to_kill = []
-                    current_python_pid = str(os.getpid())  # Don't kill our own process
-
-                    # CRITICAL: Processes that should NEVER be killed (essential system processes)
-                    protected_processes = {
-                        'systemd', 'kthreadd', 'ksoftirqd', 'migration', 'rcu_', 'watchdog',
-                        'sshd', 'ssh', 'NetworkManager', 'networkd', 'wpa_supplicant',
-                        'dbus', 'dbus-daemon', 'systemd-', 'udev', 'rsyslog', 'cron',
-                        'init', 'kernel', 'kworker', 'ksoftirq', 'migration', 'rcu_gp', 'rcu_par_gp',
-                        'wayvnc', 'vnc', 'tigervnc', 'x11vnc', 'vncserver',  # VNC servers - KEEP THESE!
-                        'Xwayland', 'labwc', 'weston', 'sway', 'wayfire',  # Display servers - KEEP THESE!
-                        'pulseaudio', 'pipewire', 'wireplumber',  # Audio systems
-                        'gdm', 'lightdm', 'sddm', 'login',  # Login managers
-                        'bash', 'zsh', 'fish', 'sh',  # Shells - keep active shells
-                        'getty', 'agetty',  # TTY processes
-                        'dhcpcd', 'dhclient',  # Network DHCP
-                        'avahi-daemon'  # Network discovery (might be needed)
-                    }
-
-                    killed_count = 0
-                    for line in lines:
-                        parts = line.split()
-                        if len(parts) >= 3:
-                            pid, comm, mem_percent = parts[0], parts[1], parts[2]
-                            try:
-                                mem_val = float(mem_percent)
-
-                                # Skip our own Python process
-                                if pid == current_python_pid:
-                                    continue
-
-                                # Check if process is protected (NEVER kill these)
-                                is_protected = False
-                                for protected in protected_processes:
-                                    if protected in comm.lower():
-                                        is_protected = True
-                                        break
-
-                                if is_protected:
-                                    continue  # Skip protected processes
-
-                                # Target ONLY specific safe memory-consuming processes
-                                should_kill = False
-
-                                # SAFE to kill: VS Code processes (development tool)
-                                if comm == 'code':
-                                    should_kill = True
-                                # SAFE to kill: Web browsers (if running)
-                                elif comm in ['chrome', 'firefox', 'chromium', 'brave']:
-                                    should_kill = True
-                                # SAFE to kill: Electron apps (often development tools)
-                                elif comm in ['electron', 'atom', 'slack', 'discord']:
-                                    should_kill = True
-                                # SAFE to kill: Other Python processes ONLY if they use significant memory
-                                elif comm == 'python3' and mem_val > 5.0:  # Higher threshold for python3
-                                    should_kill = True
-                                # SAFE to kill: Jupyter (development tool)
-                                elif 'jupyter' in comm.lower():
-                                    should_kill = True
-                                # SAFE to kill: Docker (if running)
-                                elif comm in ['docker', 'containerd']:
-                                    should_kill = True
-                                # SAFE to kill: Snap applications
-                                elif comm.startswith('snap-') or '/snap/' in comm:
-                                    should_kill = True
-                                # SAFE to kill: Ollama server (can be restarted later)
-                                elif comm == 'ollama' and mem_val > 3.0:
-                                    should_kill = True
-
-                                if should_kill:
-                                    subprocess.run(['sudo', 'kill', '-15', pid], check=False, capture_output=True)
-                                    time.sleep(0.1)
-                                    subprocess.run(['sudo', 'kill', '-9', pid], check=False, capture_output=True)
-                                    killed_count += 1
-
-                            except ValueError:
-                                continue
-
-                    if killed_count > 0:
-                        print(f"[MEMORY] Stopped {killed_count} memory-heavy processes")
-
-                # Also try to stop VS Code service if it exists
-                try:
-                    subprocess.run(['sudo', 'systemctl', 'stop', 'code'], check=False, capture_output=True)
-                    subprocess.run(['sudo', 'systemctl', 'disable', 'code'], check=False, capture_output=True)
-                except Exception:
-                    pass
-
-            except Exception as e:
-                print(f"[MEMORY] Process optimization: {e}")
-
-            # Stop only non-essential services (NOT NetworkManager!)
-            safe_services_to_stop = [
-                #'bluetooth',  # Bluetooth - safe to stop temporarily
-                'cups',  # Printing service - safe to stop
-            ]
-
-            stopped_services = 0
-            for service in safe_services_to_stop:
-                try:
-                    # Check if service is active first
-                    result = subprocess.run(['systemctl', 'is-active', service],
-                                            capture_output=True, text=True)
-                    if result.returncode == 0 and 'active' in result.stdout:
-                        subprocess.run(['sudo', 'systemctl', 'stop', service],
-                                       check=False, capture_output=True)
-                        stopped_services += 1
-                except Exception:
-                    pass
-
-            if stopped_services > 0:
-                print(f"[MEMORY] Stopped {stopped_services} non-essential services")
-
-            # System memory cleanup
-            subprocess.run(['sudo', 'sync'], check=False, capture_output=True)
-            subprocess.run(['sudo', 'sh', '-c', 'echo 3 > /proc/sys/vm/drop_caches'],
-                           check=False, capture_output=True)
-
-            # Additional memory optimizations
-            try:
-                subprocess.run(['sudo', 'sh', '-c', 'echo 1 > /proc/sys/vm/compact_memory'],
-                               check=False, capture_output=True)
-                subprocess.run(['sudo', 'swapoff', '-a'], check=False, capture_output=True)
-                time.sleep(0.5)
-                subprocess.run(['sudo', 'swapon', '-a'], check=False, capture_output=True)
-            except Exception:
-                pass
-
-            # Python garbage collection
-            import gc
-            for i in range(5):
-                collected = gc.collect()
-                if collected > 0 and i == 0:  # Only print first round
-                    print(f"[MEMORY] Garbage collection freed {collected} objects")
-
-            # Smart Python module management
-            try:
-                import sys
-                safe_modules_patterns = [
-                    'numpy', 'matplotlib', 'pandas', 'scipy', 'sklearn',
-                    'requests', 'urllib3', 'certifi', 'chardet',
-                    'PIL', 'Pillow', 'json', 'xml', 'html',
-                    'argparse', 'configparser', 'logging'
-                ]
-
-                unloaded_count = 0
-                for module_name in list(sys.modules.keys()):
-                    if any(pattern in module_name.lower() for pattern in safe_modules_patterns):
-                        if not any(
-                                x in module_name.lower() for x in ['face_gui', 'chatbot', 'camera', 'tkinter', 'cv2']):
-                            try:
-                                if module_name in sys.modules:
-                                    del sys.modules[module_name]
-                                    unloaded_count += 1
-                            except Exception:
-                                pass
-                            if unloaded_count >= 10:  # Limit to first 10
-                                break
-
-                if unloaded_count > 0:
-                    print(f"[MEMORY] Unloaded {unloaded_count} unused modules")
-
-            except Exception:
-                pass
-
-            # Smart GUI cleanup
-            try:
-                if hasattr(self.face_app, 'canvas') and self.face_app.canvas:
-                    try:
-                        items = self.face_app.canvas.find_all()
-                        if len(items) > 20:
-                            items_to_clear = []
-                            for item in items:
-                                tags = self.face_app.canvas.gettags(item)
-                                if tags and 'star' not in str(tags).lower():
-                                    items_to_clear.append(item)
-
-                            for item in items_to_clear:
-                                self.face_app.canvas.delete(item)
-
-                            if len(items_to_clear) > 0:
-                                print(f"[MEMORY] Cleaned {len(items_to_clear)} canvas items, preserved stars")
-                    except Exception:
-                        pass
-
-                # Temporary window withdrawal
-                self.root.withdraw()
-                self.root.update_idletasks()
-                time.sleep(0.2)
-
-                # Light GUI cleanup
-                self.root.tk.call('update')
-                gc.collect()
-
-            except Exception:
-                pass
-
-            # Conservative system tuning
-            try:
-                subprocess.run(['sudo', 'sh', '-c', 'echo 60 > /proc/sys/vm/vfs_cache_pressure'],
-                               check=False, capture_output=True)
-                subprocess.run(['sudo', 'sh', '-c', 'echo 8 > /proc/sys/vm/swappiness'],
-                               check=False, capture_output=True)
-                subprocess.run(['sudo', 'sync'], check=False, capture_output=True)
-                subprocess.run(['sudo', 'sh', '-c', 'echo 3 > /proc/sys/vm/drop_caches'],
-                               check=False, capture_output=True)
-            except Exception:
-                pass
-
-            # Show final memory
-            result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) >= 2:
-                    mem_line = lines[1].split()
-                    if len(mem_line) >= 7:
-                        print(f"[MEMORY] Available after cleanup: {mem_line[6]}")
+    def _start_ai_components(self, face_app):
+        """Start AI components after camera has been released.
 
-            time.sleep(0.5)  # Brief stabilization
-
-        except Exception as e:
-            print(f"[AI] Memory optimization warning: {e}")
+        Runs on the AIStartupThread worker. face_app is passed in by the
+        spawner, which resolves the lazy property on the Tk thread first -
+        touching self.face_app here could otherwise build the whole
+        MarichFaceApp (canvas, binds, initial draw) off the Tk thread.
+        """
+        # The whole memory-reclamation routine (swap setup, process kills,
+        # cache drops, module eviction, GUI trim) lives in ai_startup.py,
+        # loaded lazily here on the first AI toggle.
+        ai_startup = _lazy("ai_startup")
+        ai_startup.reclaim_memory_for_ai(face_app, self.root)
 
         print("[AI] Starting AI components with maximum available memory...")
 
         # Pre-load the AI model for faster responses
-        from chatbot_logic import preload_model
-        preload_model()
+        _lazy("chatbot_logic").preload_model()
 
         # Temporarily disable face animations to save memory during AI startup
         print("[MEMORY] Deferring face animations until after AI model loads...")
 
-        # Show memory status after model preload
-        print("[MEMORY] Final memory check after model preload:")
-        result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-        if result.returncode == 0:
-            print(result.stdout)
-
-        # Check available memory and suggest model alternatives
+        # Show memory status after model preload and warn if tight
         try:
-            result = subprocess.run(['free', '-m'], capture_output=True, text=True)
-            if result.returncode == 0:
-                lines = result.stdout.strip().split('\n')
-                if len(lines) >= 2:
-                    mem_line = lines[1].split()
-                    if len(mem_line) >= 7:
-                        available_mb = int(mem_line[6])
-                        print(f"[AI] Available memory: {available_mb}MB")
-
-                        if available_mb < 2900:  # Less than 2.9GB
-                            print(f"[AI] WARNING: Only {available_mb}MB available, but AI model needs ~2900MB")
-                            print("[AI] Attempting to start with available memory...")
+            available_mb = ai_startup.read_meminfo().get('MemAvailable', 0) // 1024
+            print(f"[AI] Available memory after model preload: {available_mb}MB")
+            if available_mb < 2900:  # Less than 2.9GB
+                print(f"[AI] WARNING: Only {available_mb}MB available, but AI model needs ~2900MB")
+                print("[AI] Attempting to start with available memory...")
         except Exception:
             pass
 
         # Start chatbot with conservative approach
         # Suppress greeting if already shown earlier in this session
-        if not hasattr(self.face_app, 'suppress_initial_greeting'):
+        if not hasattr(face_app, 'suppress_initial_greeting'):
             # First activation: allow greeting (attribute created dynamically)
-            setattr(self.face_app, 'suppress_initial_greeting', False)  # type: ignore[attr-defined]
+            setattr(face_app, 'suppress_initial_greeting', False)  # type: ignore[attr-defined]
         else:
             # Subsequent toggles skip greeting
-            setattr(self.face_app, 'suppress_initial_greeting', True)  # type: ignore[attr-defined]
+            setattr(face_app, 'suppress_initial_greeting', True)  # type: ignore[attr-defined]
 
         print("[AI] Starting chatbot thread (model already loaded)...")
 
-        self._start_chatbot_if_needed(suppress_greeting=getattr(self.face_app, 'suppress_initial_greeting', False))
+        self._start_chatbot_if_needed(suppress_greeting=getattr(face_app, 'suppress_initial_greeting', False))
 
         # Brief wait for chatbot thread to start
         time.sleep(0.5)
 
+        # All remaining work is Tk - marshal it back onto the main thread
+        # (this method now runs on the AIStartupThread worker)
+        self._schedule(0, self._finish_ai_gui_restore)
+
+    def _finish_ai_gui_restore(self):
+        """Animations + window restoration, run on the Tk main thread."""
         # Start face animations more carefully
         print("[AI] Starting face animations...")
         self._ensure_animations()
@@ -677,21 +637,9 @@ class BigMainApp:
             print("[AI] Restoring GUI...")
             self.root.deiconify()  # Restore the window
             self.root.update()
-            # Try to resume face GUI, but catch any errors from missing canvas elements
-            try:
-                self.face_app.resume()
-            except ValueError as e:
-                if "not enough values to unpack" in str(e):
-                    print("[AI] Canvas needs reinitialization, recreating face elements...")
-                    # Reinitialize the face canvas elements
-                    try:
-                        self.face_app.suspend()
-                        time.sleep(0.1)
-                        self.face_app.resume()
-                    except Exception:
-                        print("[AI] Face GUI initialization issue - continuing with basic functionality")
-                else:
-                    raise
+            # resume() self-heals via ensure_canvas() if the memory cleanup
+            # deleted face items, so no suspend/resume ping-pong is needed
+            self.face_app.resume()
         except Exception as e:
             print(f"[AI] GUI restoration: {e}")
             try:
@@ -710,8 +658,10 @@ class BigMainApp:
             try:
                 # Kill any existing camera processes before starting new one
                 self._kill_camera_processes()
-                self.camera = CameraMaster(show_windows=True)
+                self.camera = _lazy("CameraLib.camera_master_lib").CameraMaster(show_windows=True)
                 self._camera_initialized = True
+                # Start the (otherwise dormant) frame display thread
+                self._start_camera_thread()
                 print("[LAZY] Camera subsystem initialized.")
             except Exception:
                 traceback.print_exc()
@@ -720,29 +670,59 @@ class BigMainApp:
                 self._camera_initialized = False
         return self.camera is not None
 
+    def _get_obj_interpreter(self):
+        """Lazily build (once) a pre-warmed TFLite interpreter for object mode.
+
+        Returns None when no .tflite model or runtime is available, in which
+        case object mode falls back to the frozen-graph load inside
+        CameraMaster. The interpreter persists across mode entries, so
+        re-entry trades a 1-3s cold graph read for a pointer.
+        """
+        if self._tflite_obj is None and os.path.exists(self._object_tflite_path):
+            try:
+                tfl = _lazy("tflite_runtime.interpreter")
+                # Best effort: run on a Coral EdgeTPU stick if one is
+                # plugged in (the model must be the edgetpu-compiled
+                # variant); otherwise stay on the ARM CPU.
+                try:
+                    delegates = [tfl.load_delegate('libedgetpu.so.1')]
+                    print("[LAZY] EdgeTPU delegate attached for object mode.")
+                except (OSError, ValueError, AttributeError):
+                    delegates = []
+                self._tflite_obj = tfl.Interpreter(model_path=self._object_tflite_path,
+                                                   experimental_delegates=delegates)
+                self._tflite_obj.allocate_tensors()
+                print("[LAZY] TFLite object interpreter pre-warmed.")
+            except Exception as e:
+                print(f"[WARN] TFLite interpreter unavailable: {e}")
+        return self._tflite_obj
+
+    def _kill_video_device_users(self):
+        """Kill holders of every video device; returns devices cleaned.
+
+        Single implementation shared by _kill_camera_processes and the
+        AI-switch path in _release_camera_completely (which previously
+        carried a diverging copy of the same loop). Pure /proc scan, no
+        fuser forks; the device list itself is enumerated once per session.
+        """
+        killed = 0
+        for video_dev in _video_devices():
+            try:
+                if _kill_video_users(video_dev):
+                    print(f"[CAMERA] Killed processes using {video_dev}")
+                    killed += 1
+            except Exception as e:
+                print(f"[CAMERA] Cleanup {video_dev}: {e}")
+        return killed
+
     def _kill_camera_processes(self):
         """Kill any existing camera processes to prevent conflicts"""
         try:
-            import subprocess
             print("[CAMERA] Checking for existing camera processes...")
-
-            # Check and kill processes using video devices
-            for video_dev in ['/dev/video0', '/dev/video1']:
-                try:
-                    # Check if device exists
-                    if os.path.exists(video_dev):
-                        # Check processes using this video device
-                        result = subprocess.run(['fuser', '-v', video_dev],
-                                                capture_output=True, text=True)
-                        if result.returncode == 0 and result.stderr.strip():
-                            print(f"[CAMERA] Found processes using {video_dev}, killing them...")
-                            # Kill processes using the video device
-                            subprocess.run(['sudo', 'fuser', '-k', video_dev],
-                                           check=False, capture_output=True)
-                            time.sleep(0.2)  # Brief delay for cleanup
-                except Exception as e:
-                    print(f"[CAMERA] Cleanup {video_dev}: {e}")
-
+            if self._kill_video_device_users():
+                # Brief delay for cleanup - only paid when something was
+                # actually killed, and interruptible on shutdown
+                self._stop_flag.wait(0.2)
         except Exception as e:
             print(f"[CAMERA] Process cleanup warning: {e}")
 
@@ -760,58 +740,73 @@ class BigMainApp:
                 traceback.print_exc()
                 print("[WARN] Could not start animations.")
 
-    # --------------- Camera UI Loop ---------------
-    def _camera_ui_loop(self):
-        try:
-            if self.camera is None or self._camera_shutting_down:
-                # Still idle or shutting down; reschedule at a slower rate
-                if not self._stop_flag.is_set():
-                    self.root.after(300, self._camera_ui_loop)
+    # --------------- Camera Display Thread ---------------
+    def _start_camera_thread(self):
+        """Launch the camera display loop on its own thread (idempotent)."""
+        if self._cam_thread is not None and self._cam_thread.is_alive():
+            return
+        self._cam_thread = threading.Thread(
+            target=_run_with_affinity,
+            args=(self._camera_display_loop, CAMERA_CPUS),
+            daemon=True,
+            name="CameraDisplayThread"
+        )
+        self._cam_thread.start()
+
+    def _camera_display_loop(self):
+        """Frame display loop, run off the Tk main thread.
+
+        display_frame() draws into OpenCV's own windows, so nothing here
+        needs the Tk interpreter - a slow frame no longer stalls IR
+        handling, button events or face animations. The thread exits on
+        its own when the camera is released and _ensure_camera restarts
+        it with the next camera. Paced at the frame budget minus measured
+        work so effective FPS holds near target.
+        """
+        budget = 1.0 / self._target_fps
+        while not self._stop_flag.is_set():
+            cam = self.camera
+            if cam is None or self._camera_shutting_down:
+                # No camera: thread ends; the idle default state runs zero
+                # camera work at all.
                 return
-            key = self.camera.display_frame()
+            t0 = time.perf_counter()
+            try:
+                key = cam.display_frame()
+            except Exception:
+                key = -1
+            net = time.perf_counter() - t0
             if key == ord('q'):
                 print('[KEY] q pressed - shutting down')
-                self.shutdown()
+                # shutdown() touches Tk - marshal it onto the main thread
+                self.root.after(0, self.shutdown)
+                return
+            remaining = budget - net
+            if remaining > 0 and self._stop_flag.wait(remaining):
                 return
-        except Exception:
-            pass
-        if not self._stop_flag.is_set():
-            self.root.after(50, self._camera_ui_loop)
 
     # --------------- Mode Management ---------------
     def _stop_all_camera_modes(self):
         print("[MODE] Stopping all camera modes...")
 
+        # Broadcast stop to every running mode before the blocking joins below
+        self._signal_all_stops()
+
         # Stop RPS game if running
-        if self._rps_started:
+        if self._rps.started:
             self._stop_rps_if_running()
             
         # --- NEW: Stop presentation if running ---
-        if self._presentation_started:
+        if self._presentation.started:
             self._stop_presentation_if_running()
         # --- END NEW ---
 
         if self.camera:
-            try:
-                self.camera.stop_color_tracking()
-            except Exception:
-                pass
-            try:
-                self.camera.stop_face_tracking()
-            except Exception:
-                pass
-            try:
-                self.camera.stop_gesture_following()
-            except Exception:
-                pass
-            try:
-                self.camera.stop_object_recognition()
-            except Exception:
-                pass
-            try:
-                self.camera.stop_license_plate_recognition()
-            except Exception:
-                pass
+            for stop_name, _label in self._CAMERA_STOP_METHODS:
+                try:
+                    getattr(self.camera, stop_name)()
+                except Exception:
+                    pass
         self.active_mode = None
         self.active_color = None
         motor_stop()
@@ -848,12 +843,15 @@ class BigMainApp:
         """Completely release and close the camera to free up memory"""
         print("[CAMERA] Releasing camera completely...")
 
+        # Broadcast stop to every running mode before the blocking joins below
+        self._signal_all_stops()
+
         # Stop RPS game first if it's running
-        if self._rps_started:
+        if self._rps.started:
             self._stop_rps_if_running()
             
         # --- NEW: Stop presentation if running ---
-        if self._presentation_started:
+        if self._presentation.started:
             self._stop_presentation_if_running()
         # --- END NEW ---
 
@@ -862,35 +860,19 @@ class BigMainApp:
 
         # First stop all modes safely
         if self.camera is not None:
-            print("Stopping camera modes...")
-            try:
-                self.camera.stop_color_tracking()
-                print("Color tracker stopped")
-            except Exception as e:
-                print(f"Color tracker stop error: {e}")
-            try:
-                self.camera.stop_face_tracking()
-                print("Face tracker stopped")
-            except Exception as e:
-                print(f"Face tracker stop error: {e}")
-            try:
-                self.camera.stop_gesture_following()
-                print("Gesture tracker stopped")
-            except Exception as e:
-                print(f"Gesture tracker stop error: {e}")
-            try:
-                self.camera.stop_object_recognition()
-                print("Object recognition stopped")
-            except Exception as e:
-                print(f"Object recognition stop error: {e}")
-            try:
-                self.camera.stop_license_plate_recognition()
-                print("License plate recognition stopped")
-            except Exception as e:
-                print(f"License plate stop error: {e}")
+            # Collect the per-mode status lines and flush them in one write
+            status_lines = ["Stopping camera modes..."]
+            for stop_name, label in self._CAMERA_STOP_METHODS:
+                try:
+                    getattr(self.camera, stop_name)()
+                    status_lines.append(f"{label} stopped")
+                except Exception as e:
+                    status_lines.append(f"{label} stop error: {e}")
+            self._log_lines(*status_lines)
 
             # Give a longer delay for processes to clean up properly
-            time.sleep(0.3)
+            # (interruptible: a shutdown mid-cleanup doesn't block here)
+            self._stop_flag.wait(0.3)
 
             # Now release the camera completely
             try:
@@ -918,71 +900,46 @@ class BigMainApp:
             except Exception as e:
                 print(f"Face emotion set error: {e}")
 
-        # Force garbage collection to free memory
-        import gc
-        gc.collect()
+        # No explicit gc.collect() here: release_all() plus the
+        # `self.camera = None` above drop the refcounts to zero, so the
+        # camera/OpenCV buffers are reclaimed deterministically. A full
+        # generational sweep holds the GIL for hundreds of ms on the Pi.
+        if DEBUG_MEM:
+            gc.collect(2)
 
         # Additional memory cleanup and camera process killing when switching to AI mode
         if self.ai_enabled:
             try:
-                import subprocess
                 print("[MEMORY] Aggressive memory cleanup for AI startup...")
 
-                # Kill any remaining camera processes
-                print("[CAMERA] Checking for camera processes...")
-                # Check available video devices
-                result = subprocess.run(['ls', '/dev/video*'], capture_output=True, text=True, shell=True)
-                if result.returncode == 0:
-                    print(f"[CAMERA] Available video devices: {result.stdout.strip()}")
+                # Kill any remaining camera processes (pure /proc scan, no
+                # fuser/ls forks - the diagnostic `ls /dev/video*` and
+                # `free -h` calls were fork+exec for logging only)
+                self._kill_video_device_users()
 
-                # Kill processes using video devices
-                for video_dev in ['/dev/video0', '/dev/video1']:
-                    try:
-                        # Check processes using this video device
-                        result = subprocess.run(['fuser', '-v', video_dev],
-                                                capture_output=True, text=True)
-                        if result.returncode == 0 and result.stderr.strip():
-                            print(f"[CAMERA] Processes using {video_dev}:")
-                            print(result.stderr)
-                            # Kill processes using the video device
-                            subprocess.run(['sudo', 'fuser', '-k', video_dev],
-                                           check=False, capture_output=True)
-                            print(f"[CAMERA] Killed processes using {video_dev}")
-                    except Exception as e:
-                        print(f"[CAMERA] Video device {video_dev} cleanup: {e}")
-
-                # Show memory before cache clear
-                print("[MEMORY] Memory before cache clear:")
-                result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(result.stdout)
-
-                # Sync and clear caches
-                subprocess.run(['sudo', 'sync'], check=False, capture_output=True)
-                subprocess.run(['sudo', 'sh', '-c', 'echo 3 > /proc/sys/vm/drop_caches'],
-                               check=False, capture_output=True)
-
-                # Show memory after cache clear
-                print("[MEMORY] Memory after cache clear:")
-                result = subprocess.run(['free', '-h'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(result.stdout)
-
-                # Additional garbage collection
-                for _ in range(2):
-                    gc.collect()
+                # Sync and clear caches (direct sysctl write via ai_startup,
+                # which the AI path is about to load anyway)
+                os.sync()
+                _lazy("ai_startup")._write_sysctl('/proc/sys/vm/drop_caches', 3)
+                print(f"[MEMORY] Available after cache clear: "
+                      f"{_lazy('ai_startup').read_meminfo().get('MemAvailable', 0) // 1024}MB")
 
             except Exception as e:
                 print(f"[MEMORY] Cache clear warning: {e}")
 
         print("[CAMERA] Camera completely released and memory freed.")
 
-        # If AI was just enabled, start AI components after camera release
+        # If AI was just enabled, start AI components after camera release -
+        # on a worker thread so the Tk event loop stays responsive
         if self.ai_enabled:
-            self._start_ai_components()
+            # args resolves the lazy face_app property on the Tk thread
+            # before the worker starts (see _toggle_ai)
+            threading.Thread(target=self._start_ai_components,
+                             args=(self.face_app,),
+                             daemon=True, name="AIStartupThread").start()
 
     def _start_color_mode(self, color_name):
-        if self.ai_enabled or self._presentation_started: # MODIFIED
+        if self.ai_enabled or self._presentation.started: # MODIFIED
             print("[MODE] Cannot start camera modes while AI or Presentation is enabled. Disable AI first.")
             return
         if self.active_mode != 'color' or self.active_color != color_name:
@@ -1001,10 +958,9 @@ class BigMainApp:
                     self.face_app.set_emotion('happy')
                 
                 # --- QoL FIX: Set LED to tracking color ---
-                # Raspbot color codes: Red:0, Green:1, Blue:2, Yellow:3
-                color_index_map = {'red': 0, 'green': 1, 'blue': 2, 'yellow': 3}
-                # Default to White (6) if color_name is not in our map
-                color_index = color_index_map.get(color_name.lower(), 6) 
+                # Default to White (6) if color_name is not in our map; the
+                # IR dispatch table only ever passes lowercase names
+                color_index = _LED_COLOR_INDEX.get(color_name, 6)
                 try:
                     self.bot.Ctrl_WQ2812_ALL(1, color_index)
                 except Exception as e:
@@ -1016,7 +972,7 @@ class BigMainApp:
                 print("[ERROR] Could not start color tracking.")
 
     def _start_face_mode(self):
-        if self.ai_enabled or self._presentation_started: # MODIFIED
+        if self.ai_enabled or self._presentation.started: # MODIFIED
             print("[MODE] Cannot start camera modes while AI or Presentation is enabled. Disable AI first.")
             return
         if self.active_mode != 'face':
@@ -1038,7 +994,7 @@ class BigMainApp:
                 print("[ERROR] Could not start face mode.")
 
     def _start_gesture_mode(self):
-        if self.ai_enabled or self._presentation_started: # MODIFIED
+        if self.ai_enabled or self._presentation.started: # MODIFIED
             print("[MODE] Cannot start camera modes while AI or Presentation is enabled. Disable AI first.")
             return
         if self.active_mode != 'gesture':
@@ -1060,7 +1016,7 @@ class BigMainApp:
                 print("[ERROR] Could not start gesture mode.")
 
     def _start_object_mode(self):
-        if self.ai_enabled or self._presentation_started: # MODIFIED
+        if self.ai_enabled or self._presentation.started: # MODIFIED
             print("[MODE] Cannot start camera modes while AI or Presentation is enabled. Disable AI first.")
             return
         if self.active_mode != 'object':
@@ -1070,24 +1026,12 @@ class BigMainApp:
                 print("[ERROR] Camera unavailable.")
                 return
             
-            # --- FIX: Use BASE_DIR for reliable model paths ---
-            global BASE_DIR # Access the global variable defined at the top of the file
-            model_path = os.path.join(BASE_DIR, 'CameraLib', '04.Tensorflow_object_recognition',
-                                      'ssdlite_mobilenet_v2_coco_2018_05_09', 'frozen_inference_graph.pb')
-            label_map_path = os.path.join(BASE_DIR, 'CameraLib', '04.Tensorflow_object_recognition', 'data',
-                                          'mscoco_label_map.pbtxt')
-            # --- END FIX ---
-            
-            abs_model = os.path.abspath(model_path)
-            abs_labels = os.path.abspath(label_map_path)
-            model_ok = os.path.exists(model_path)
-            labels_ok = os.path.exists(label_map_path)
-            if not (model_ok and labels_ok):
+            # Paths are resolved and checked once in __init__; mode entry is
+            # a cached-bool test instead of ~6 stat()/abspath calls
+            if not self._object_assets_ok:
                 print("[ERROR] Object model resources missing.")
-                if not model_ok:
-                    print(f"  Missing model: {abs_model}")
-                if not labels_ok:
-                    print(f"  Missing label map: {abs_labels}")
+                print(f"  Expected model: {self._object_model_path}")
+                print(f"  Expected label map: {self._object_labels_path}")
                 print("  Expected directory layout:")
                 print("    04.Tensorflow_object_recognition/")
                 print("      ssdlite_mobilenet_v2_coco_2018_05_09/frozen_inference_graph.pb")
@@ -1099,7 +1043,20 @@ class BigMainApp:
                 return
             try:
                 assert self.camera is not None
-                self.camera.start_object_recognition(model_path, label_map_path)
+                interpreter = self._get_obj_interpreter()
+                if interpreter is not None:
+                    try:
+                        self.camera.start_object_recognition(self._object_model_path,
+                                                             self._object_labels_path,
+                                                             interpreter=interpreter)
+                    except TypeError:
+                        # Vendored CameraMaster without interpreter support -
+                        # fall back to the frozen-graph load
+                        self.camera.start_object_recognition(self._object_model_path,
+                                                             self._object_labels_path)
+                else:
+                    self.camera.start_object_recognition(self._object_model_path,
+                                                         self._object_labels_path)
                 self.active_mode = 'object'
                 # Only show emotions and animations if AI is enabled
                 if self.ai_enabled:
@@ -1110,7 +1067,7 @@ class BigMainApp:
                 print("[ERROR] Could not start object recognition.")
 
     def _start_plate_mode(self):
-        if self.ai_enabled or self._presentation_started: # MODIFIED
+        if self.ai_enabled or self._presentation.started: # MODIFIED
             print("[MODE] Cannot start camera modes while AI or Presentation is enabled. Disable AI first.")
             return
         if self.active_mode != 'plate':
@@ -1119,10 +1076,10 @@ class BigMainApp:
             if not self._ensure_camera():
                 print("[ERROR] Camera unavailable.")
                 return
-            font_path = '07.Camera-Based_License_plate_recognition/platech.ttf'
             try:
                 assert self.camera is not None
-                self.camera.start_license_plate_recognition(font_path=font_path, detect_level='low')
+                self.camera.start_license_plate_recognition(font_path=self._plate_font_path,
+                                                            detect_level='low')
                 self.active_mode = 'plate'
                 # Only show emotions and animations if AI is enabled
                 if self.ai_enabled:
@@ -1135,80 +1092,95 @@ class BigMainApp:
     # --------------- IR Loop ---------------
     def _ir_loop(self):
         print("[IR] Listening for IR codes...")
+        # Keep the IR poller on the GUI-side cores, off the camera cores
+        try:
+            os.sched_setaffinity(0, GUI_CPUS & set(range(os.cpu_count() or 1)))
+        except (AttributeError, OSError, TypeError):
+            pass
+        # Adaptive polling: sleep 20 ms when idle, drop to 5 ms for ~1 s after
+        # any button press (the user is actively pressing), then back off
+        # exponentially toward 50 ms. Saves CPU for the GUI/camera when idle
+        # while keeping button latency low during interaction.
+        interval = 0.02
+        active_until = 0.0
         while not self._stop_flag.is_set():
             try:
+                # NOTE: read_data_array is a blocking I2C transaction inside
+                # Raspbot_Lib. If that library's native read ever holds the
+                # GIL it stalls the Tk and chatbot threads for ~1 ms per poll;
+                # the fix (release the GIL around the ioctl) belongs in
+                # Raspbot_Lib itself, which is vendored outside this repo.
                 data = self.bot.read_data_array(0x0c, 1)
                 if data and isinstance(data, list):
                     code = data[0]
-                    now = time.time()
+                    # Monotonic clock for debounce - wall time jumps under NTP
+                    mono = time.monotonic()
                     if code != 0 and code < 0xFF:
-                        # Debounce
+                        # User is actively pressing buttons - poll fast for a while
+                        interval = 0.005
+                        active_until = mono + 1.0
+                        # Debounce (per-code timestamps)
                         if not IR_DEBUG:
-                            if code == self._last_ir_code and (now - self._last_ir_time) < IR_DEBOUNCE_SEC:
-                                time.sleep(0.05)
+                            if (mono - self._ir_last_times.get(code, 0.0)) < IR_DEBOUNCE_SEC:
+                                if self._stop_flag.wait(interval):
+                                    break
                                 continue
+                        self._ir_last_times[code] = mono
                         self._last_ir_code = code
-                        self._last_ir_time = now
+                        self._last_ir_time = mono
                         print(f"[IR] Code: 0x{code:02X}")
                         self._handle_ir_code(code)
-                time.sleep(0.05)
+                    elif mono > active_until:
+                        # Idle - back off exponentially toward 50 ms
+                        interval = min(0.05, interval * 1.25)
+                # Event.wait doubles as the poll sleep AND the shutdown
+                # condvar: a set() from shutdown() wakes this thread
+                # immediately instead of after up to a full interval.
+                if self._stop_flag.wait(interval):
+                    break
             except Exception:
-                time.sleep(0.1)
+                if self._stop_flag.wait(0.1):
+                    break
+
+    def _on_ir_exit(self):
+        print("[IR] Exit command received.")
+        self.shutdown()
 
     def _handle_ir_code(self, code):
-        if code == IR_COLOR_RED:
-            self._start_color_mode('red')
-        elif code == IR_COLOR_BLUE:
-            self._start_color_mode('blue')
-        elif code == IR_COLOR_GREEN:
-            self._start_color_mode('green')
-        elif code == IR_COLOR_YELLOW:
-            self._start_color_mode('yellow')
-        elif code == IR_FACE_MODE:
-            self._start_face_mode()
-        elif code == IR_GESTURE_MODE:
-            self._start_gesture_mode()
-        elif code == IR_OBJECT_MODE:
-            self._start_object_mode()
-        elif code == IR_PLATE_MODE:
-            self._start_plate_mode()
-        elif code == IR_RPS_GAME:
-            self.root.after(0, self._start_rps_if_needed)  # Schedule on main thread
-        # --- NEW: Handle presentation button ---
-        elif code == IR_PRESENTATION:
-            self.root.after(0, self._start_presentation_mode)
-        # --- END NEW ---
-        elif code == IR_AI_TOGGLE:
-            self.root.after(0, self._toggle_ai)  # Schedule on main thread
-        elif code == IR_STOP_ALL:
-            # Schedule camera release on main thread to avoid Qt threading issues
-            self.root.after(10, self._release_camera_completely)
-        elif code == IR_EXIT_APP:
-            print("[IR] Exit command received.")
-            self.shutdown()
-        
-        else:
-            if IR_DEBUG:
-                print(f"[IR] Unmapped code: 0x{code:02X}")
+        # Single dict lookup instead of a linear if/elif scan over every code
+        handler = self._ir_dispatch.get(code)
+        if handler:
+            handler()
+        elif IR_DEBUG:
+            print(f"[IR] Unmapped code: 0x{code:02X}")
         trigger_beep()
 
     # --------------- Helper ---------------
+    @staticmethod
+    def _log_lines(*lines):
+        """Emit several status lines with one write syscall instead of one
+        lock-acquire + write per print (noticeable on a serial TTY)."""
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
+
     def _print_help(self):
-        print("\n=== IR COMMAND MAP ===")
-        print(f"Red Color Mode      : 0x{IR_COLOR_RED:02X}")
-        print(f"Blue Color Mode     : 0x{IR_COLOR_BLUE:02X}")
-        print(f"Green Color Mode    : 0x{IR_COLOR_GREEN:02X}")
-        print(f"Yellow Color Mode   : 0x{IR_COLOR_YELLOW:02X}")
-        print(f"Face Tracking Mode  : 0x{IR_FACE_MODE:02X}")
-        print(f"Gesture Mode        : 0x{IR_GESTURE_MODE:02X}")
-        print(f"Object Recognition  : 0x{IR_OBJECT_MODE:02X}")
-        print(f"License Plate Mode  : 0x{IR_PLATE_MODE:02X}")
-        print(f"RPS Game Mode       : 0x{IR_RPS_GAME:02X}")
-        print(f"Presentation Mode   : 0x{IR_PRESENTATION:02X}") # --- NEW ---
-        print(f"AI Toggle           : 0x{IR_AI_TOGGLE:02X}")
-        print(f"Stop All            : 0x{IR_STOP_ALL:02X}")
-        print(f"Exit App            : 0x{IR_EXIT_APP:02X}")
-        print("=================================================================\n")
+        self._log_lines(
+            "\n=== IR COMMAND MAP ===",
+            f"Red Color Mode      : 0x{IR_COLOR_RED:02X}",
+            f"Blue Color Mode     : 0x{IR_COLOR_BLUE:02X}",
+            f"Green Color Mode    : 0x{IR_COLOR_GREEN:02X}",
+            f"Yellow Color Mode   : 0x{IR_COLOR_YELLOW:02X}",
+            f"Face Tracking Mode  : 0x{IR_FACE_MODE:02X}",
+            f"Gesture Mode        : 0x{IR_GESTURE_MODE:02X}",
+            f"Object Recognition  : 0x{IR_OBJECT_MODE:02X}",
+            f"License Plate Mode  : 0x{IR_PLATE_MODE:02X}",
+            f"RPS Game Mode       : 0x{IR_RPS_GAME:02X}",
+            f"Presentation Mode   : 0x{IR_PRESENTATION:02X}",  # --- NEW ---
+            f"AI Toggle           : 0x{IR_AI_TOGGLE:02X}",
+            f"Stop All            : 0x{IR_STOP_ALL:02X}",
+            f"Exit App            : 0x{IR_EXIT_APP:02X}",
+            "=================================================================\n",
+        )
 
     # --------------- Shutdown ---------------
     def shutdown(self):
@@ -1216,6 +1188,8 @@ class BigMainApp:
             return
         print("[SYS] Shutting down...")
         self._stop_flag.set()
+        # Broadcast stop to all modes first so their joins overlap
+        self._signal_all_stops()
         try:
             self.bot.Ctrl_IR_Switch(0)
         except Exception:
@@ -1241,12 +1215,20 @@ class BigMainApp:
 
         # --- FIX: Schedule GUI destruction on the main thread ---
         try:
-            # self.root.quit()   <--- REMOVE
-            # self.root.destroy() <--- REMOVE
+            # Cancel every pending callback we scheduled so none of them
+            # fire against widgets destroy() is about to tear down
+            for aid in list(self._after_ids):
+                try:
+                    self.root.after_cancel(aid)
+                except tk.TclError:
+                    pass
+            self._after_ids.clear()
 
             # Post the destroy() command to the main thread's event
-            # queue. This is the only thread-safe way to close Tkinter.
-            self.root.after(10, self.root.destroy)
+            # queue. This is the only thread-safe way to close Tkinter;
+            # after_idle runs it as soon as the queue drains instead of
+            # queueing behind other timers for a further 10 ms.
+            self.root.after_idle(self.root.destroy)
         except Exception as e:
             # This might fail if the root is already in a bad state
             print(f"[SYS] Error scheduling GUI shutdown: {e}")
@@ -1273,11 +1255,21 @@ def validate_setup():
         Config.PIPER_MODEL,
         Config.PIPER_CONFIG
     ]
-    ok = True
+    # Group by parent directory: one scandir per directory instead of one
+    # stat per path (the Piper binary/model/config share a directory)
+    grouped = {}
     for path in required_paths:
-        if not os.path.exists(path):
-            print(f"[WARN] Missing: {path}")
-            ok = False
+        grouped.setdefault(os.path.dirname(path) or '.', []).append(path)
+    ok = True
+    for parent, paths in grouped.items():
+        try:
+            present = {entry.name for entry in os.scandir(parent)}
+        except OSError:
+            present = set()
+        for path in paths:
+            if os.path.basename(path) not in present:
+                print(f"[WARN] Missing: {path}")
+                ok = False
     if not ok:
         print("[INFO] You can still run camera modes without voice/AI.")
     return True  # Allow run anyway
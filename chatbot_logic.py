@@ -3,10 +3,18 @@
 # This module contains the main logic for the chatbot, including
 # voice recognition, LLM interaction, and command handling.
 
+import collections
 import os
 import json
 import pyaudio
+import queue
+import re
+import sched
 import subprocess
+try:
+    import audioop  # C-level RMS for the VAD gate; dropped in Python 3.13
+except ImportError:
+    audioop = None
 from vosk import Model, KaldiRecognizer, SetLogLevel
 
 # --- Ollama (LLM) Import with graceful compatibility shim ---
@@ -36,9 +44,24 @@ except Exception as _e_ollama:
     ollama = None  # type: ignore
     _OLLAMA_OK = False
     _OLLAMA_ERR = _e_ollama
+
+# One shared client reuses a single HTTP connection to the Ollama daemon;
+# the module-level ollama.chat() helper builds a fresh session per call.
+OLLAMA_CLIENT = ollama.Client() if _OLLAMA_OK else None
+
+# Sent with every chat call: spread inference over all cores and shrink
+# the context window from the model's full default. num_ctx bounds the
+# prompt PLUS the generated reply, so it sits at double the ~512-token
+# history budget: a full history still leaves room for the response
+# (and for the chars/4 estimate under-counting punctuation-heavy JSON)
+# without triggering Ollama's context shift, which can evict the
+# system prompt mid-reply.
+_OLLAMA_OPTIONS = {"num_thread": os.cpu_count(), "num_ctx": 1024}
 import threading
 import time
 
+import stop_registry
+
 # Import the necessary components from other modules
 from face_gui import MarichFaceApp, Config
 from robot_hardware import (
@@ -61,26 +84,253 @@ conversation_history = [
         "Act emotional - if insulted, respond with anger; if someone laughs, be happy."
     )}
 ]
-motor_timer = None
+# Guards every read/mutation of conversation_history: the chatbot loop
+# owns it today, but helper threads (sensor poll, future features) must
+# never observe it mid-trim, and the global is no longer rebound
+# per turn - all updates mutate the one list in place under this lock.
+HISTORY_LOCK = threading.Lock()
+
+
+class _TimerWheel:
+    """One background thread serving all delayed callbacks.
+
+    threading.Timer spawns (and tears down) a whole OS thread per delay,
+    and movement commands and pats fire these constantly. sched.scheduler
+    is thread-safe, so a single persistent daemon thread can run every
+    timed callback; callers keep the returned handle and cancel with it.
+    """
+
+    def __init__(self):
+        self._sched = sched.scheduler(time.monotonic, time.sleep)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _run(self):
+        while True:
+            # run(blocking=False) fires everything due and returns the
+            # delay until the next event (or None when the queue is empty)
+            delay = self._sched.run(blocking=False)
+            self._wake.wait(delay if delay is not None else 1.0)
+            self._wake.clear()
+
+    @staticmethod
+    def _guard(fn):
+        """Run one callback, swallowing its errors.
+
+        sched.run re-raises action exceptions, which would kill the one
+        shared thread for good - every later timer (including the 0.5s
+        motor auto-stop) would silently never fire. Same pattern as the
+        hardware worker loops in robot_hardware.
+        """
+        try:
+            fn()
+        except Exception as e:
+            print(f"Timer callback error: {e}")
+
+    def call_later(self, delay, fn):
+        """Schedule fn() after delay seconds; returns a cancel handle."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True,
+                                                name="TimerWheel")
+                self._thread.start()
+        handle = self._sched.enter(delay, 0, self._guard, (fn,))
+        self._wake.set()
+        return handle
+
+    def cancel(self, handle):
+        """Cancel a pending callback; a no-op if it already fired."""
+        try:
+            if handle is not None:
+                self._sched.cancel(handle)
+        except ValueError:
+            pass  # Already ran or already cancelled
+
+
+_timers = _TimerWheel()
+motor_timer = None  # _TimerWheel handle for the pending auto-stop
+# Guards motor_timer: the chatbot loop rebinds it when arming the
+# auto-stop and the timer-wheel thread clears it inside stop_car, so an
+# unlocked cancel/assign race could orphan a pending handle.
+MOTOR_TIMER_LOCK = threading.Lock()
 _model_preloaded = False  # Track if model is already loaded
 
-def preload_model():
-    """Pre-load the AI model to speed up first response"""
+# Sentence boundaries for the streaming TTS pipeline
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Movement commands, hoisted to module scope so the dispatch regexes below
+# can be compiled once at import. (The old " moveleft" key had a leading
+# space and could never match; fixed to "move left".)
+MOVEMENT_COMMANDS = {
+    "move forward": move_forward, "move back": move_backward, "move backward": move_backward,
+    "move right": move_right, "move left": move_left, "turn right": rotate_right, "turn left": rotate_left,
+    "move front left": move_diagonal_left_front, "move front right": move_diagonal_right_front,
+    "move back left": move_diagonal_left_back, "move back right": move_diagonal_right_back
+}
+
+# One C-level alternation scan per intent group instead of ~20 Python-level
+# `in` tests per utterance. Longest alternatives first so e.g. "move back
+# left" wins over "move back".
+_MOVEMENT_RE = re.compile(
+    r'\b(' + '|'.join(re.escape(k) for k in
+                      sorted(MOVEMENT_COMMANDS, key=len, reverse=True)) + r')\b')
+_DANCE_RE = re.compile(r"\b(?:dance|party|let's dance)\b")
+# Matches a complete "text": "..." field (with escapes) in a streaming,
+# possibly still-unterminated JSON response
+_LLM_TEXT_RE = re.compile(r'"text"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# 16-bit RMS below which a 30ms chunk counts as silence for the VAD gate
+_SILENCE_RMS = 300
+
+# Utterances that end the session, as an O(1)-membership frozenset
+_EXIT_COMMANDS = frozenset({"goodbye", "bye", "by", "exit", "quit"})
+_PATROL_RE = re.compile(r'\b(?:move square|car patrol)\b')
+_HELP_RE = re.compile(r'\b(?:help|options)\b')
+
+# Canned small-talk: (reply, emotion) looked up by the exact utterance.
+# On CPU-only Ollama even a one-word greeting costs seconds of prefill,
+# so these skip the LLM entirely - and stay out of conversation_history,
+# so they never eat into the prompt token budget either.
+CANNED_RESPONSES = {
+    "hello": ("Hello there! What can I do for you?", 'happy'),
+    "hi": ("Hi! Nice to see you!", 'happy'),
+    "hey": ("Hey! I'm listening.", 'happy'),
+    "good morning": ("Good morning! Ready for a great day?", 'happy'),
+    "good night": ("Good night! Sleep well!", 'neutral'),
+    "thank you": ("You're very welcome!", 'happy'),
+    "thanks": ("Any time!", 'happy'),
+    "how are you": ("I'm doing great! All my circuits are happy.", 'happy'),
+    "what is your name": ("I'm Marich, your robot car!", 'happy'),
+    "who are you": ("I'm Marich, your robot car!", 'happy'),
+    "yes": ("Great!", 'happy'),
+    "no": ("Okay, no problem.", 'neutral'),
+    "okay": ("Okay!", 'neutral'),
+}
+
+# Vosk model warmed by preload_model() and reused by run_chatbot, so the
+# ~second-long model load is not paid again when the chatbot starts
+_vosk_model = None
+
+
+def _warm_llm():
+    """Pre-load the AI model to speed up first response."""
     global _model_preloaded
+    try:
+        print("[AI] Pre-loading model for faster responses...")
+        # Make a simple test call to load the model into memory
+        test_history = [
+            {'role': 'system', 'content': 'You are an AI. Respond with just {"text": "ready", "emotion": "neutral"}'},
+            {'role': 'user', 'content': 'hello'}
+        ]
+        response = OLLAMA_CLIENT.chat(model=Config.LLM_MODEL, messages=test_history, format='json',
+                                      keep_alive=Config.OLLAMA_KEEP_ALIVE, options=_OLLAMA_OPTIONS)
+        _model_preloaded = True
+        print("[AI] Model pre-loaded successfully")
+    except Exception as e:
+        print(f"[AI] Model pre-load warning: {e}")
+        # Continue anyway - model will load on first real use
+
+
+def _warm_vosk():
+    """Load the Vosk model and run one decode pass on silence.
+
+    Loading faults the mmapped FST/acoustic model into RAM and the dummy
+    decode touches the hot code paths, so the first real utterance isn't
+    slowed by page faults. The loaded model is cached for run_chatbot.
+    """
+    global _vosk_model
+    try:
+        SetLogLevel(-1)
+        _vosk_model = Model(Config.VOSK_MODEL_PATH)
+        warm_rec = KaldiRecognizer(_vosk_model, 16000)
+        warm_rec.AcceptWaveform(bytes(1280))  # 40 ms of silence
+        print("[AI] Vosk model pre-loaded")
+    except Exception as e:
+        print(f"[AI] Vosk pre-load warning: {e}")
+
+
+def preload_model():
+    """Warm the LLM, the Piper voice, and the Vosk decoder in parallel.
+
+    Each engine pays its cold-start cost exactly once; overlapping the
+    three warm-ups keeps total startup wall-time at max() instead of
+    sum() of the individual load times.
+    """
+    threads = []
     if _OLLAMA_OK and ollama is not None and not _model_preloaded:
+        threads.append(threading.Thread(target=_warm_llm, name="WarmLLM"))
+    threads.append(threading.Thread(target=_piper_engine.warm, name="WarmPiper"))
+    if _vosk_model is None:
+        threads.append(threading.Thread(target=_warm_vosk, name="WarmVosk"))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+def _keep_alive_watchdog(stop_event):
+    """Re-pin the LLM weights every 60s until the chatbot stops.
+
+    Belt-and-braces on top of keep_alive=-1: an empty-message chat call
+    refreshes Ollama's TTL without generating anything, so the model can
+    never be silently evicted between user turns.
+    """
+    while not stop_event.wait(60.0):
         try:
-            print("[AI] Pre-loading model for faster responses...")
-            # Make a simple test call to load the model into memory
-            test_history = [
-                {'role': 'system', 'content': 'You are an AI. Respond with just {"text": "ready", "emotion": "neutral"}'},
-                {'role': 'user', 'content': 'hello'}
-            ]
-            response = ollama.chat(model=Config.LLM_MODEL, messages=test_history, format='json')
-            _model_preloaded = True
-            print("[AI] Model pre-loaded successfully")
-        except Exception as e:
-            print(f"[AI] Model pre-load warning: {e}")
-            # Continue anyway - model will load on first real use
+            OLLAMA_CLIENT.chat(model=Config.LLM_MODEL, messages=[],
+                               keep_alive=Config.OLLAMA_KEEP_ALIVE)
+        except Exception:
+            pass  # Ollama down or restarting; next tick retries
+
+
+def _sensor_poll_loop(bot, highfive_event, scared_event, stop_event):
+    """Ultrasonic + line-tracker polling on a dedicated thread.
+
+    The audio loop used to interleave these I2C reads with blocking
+    stream.read calls, so sensor reaction time was bounded by the audio
+    chunk period and every I2C stall delayed the ASR pipeline. This loop
+    owns all the register reads and just posts events; the audio loop
+    checks the flags with no I/O at all.
+    """
+    high_five_state = "idle"  # "idle" or "approached"
+    approached_time = 0.0
+    while not stop_event.wait(0.1):
+        now = time.time()
+
+        # 1. High-Five Logic (Ultrasonic)
+        try:
+            # One 2-byte burst from 0x1a (Low, High) instead of two
+            # single-byte transactions: halves the I2C traffic and, more
+            # importantly, both bytes come from the same measurement so a
+            # reading can't be stitched from two different samples.
+            data = bot.read_data_array(0x1a, 2)
+            if data and len(data) >= 2:
+                distance_mm = (data[1] << 8) | data[0]
+            else:
+                distance_mm = 999  # Default high distance if read fails
+
+            if high_five_state == "idle" and distance_mm < 120:  # Hand approached
+                high_five_state = "approached"
+                approached_time = now
+            elif high_five_state == "approached":
+                if distance_mm > 170:  # Hand receded
+                    if (now - approached_time) < 1.0:  # Fast enough = high five
+                        highfive_event.set()
+                    high_five_state = "idle"
+                elif (now - approached_time) > 1.5:  # Held too long, reset
+                    high_five_state = "idle"
+        except Exception:
+            pass  # Ignore I2C errors
+
+        # 2. Scared Logic (Line Tracker)
+        try:
+            track_data = bot.read_data_array(0x0a, 1)
+            track = track_data[0] if track_data else 0
+            if (track & 0x0F) == 0x00:  # No ground under any sensor
+                scared_event.set()
+        except Exception:
+            pass  # Ignore I2C errors
+
 
 def stop_car():
     """Stops the car, cancels pending timers, and resets LEDs to neutral."""
@@ -88,14 +338,133 @@ def stop_car():
     stop()
     set_emotion_led('neutral') # Reset LEDs when stopping
     print("Car stopped. LEDs reset to neutral.")
-    if motor_timer and motor_timer.is_alive():
-        motor_timer.cancel()
+    with MOTOR_TIMER_LOCK:
+        _timers.cancel(motor_timer)
         motor_timer = None
 
+class _PiperEngine:
+    """Long-lived Piper + aplay pipeline shared by every utterance.
+
+    Spawning Piper per utterance reloaded the ONNX voice model from disk
+    each time (hundreds of ms before any audio). Here Piper runs once in
+    --output-raw --json-input mode; a pump thread copies its PCM into a
+    persistent aplay. Raw output carries no per-utterance end marker, so
+    completion needs two signals: the stream has gone quiet (synthesis
+    done) AND the playback clock has run out. Quiescence alone is not
+    enough - Piper synthesizes faster than realtime, so the pipe and
+    ALSA buffers can swallow a whole utterance almost instantly while
+    seconds of audio are still sounding; the pumped byte count divided
+    by the PCM rate says when the speaker is actually done. A lock
+    serializes utterances.
+    """
+
+    _QUIET_SEC = 0.4    # Raw stream quiet this long = synthesis finished
+    _NO_AUDIO_SEC = 8.0  # Give up waiting if Piper produced nothing
+    _BYTES_PER_SEC = 22050 * 2  # S16_LE mono at 22.05 kHz (aplay args)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._piper = None
+        self._aplay = None
+        self._last_audio = 0.0  # monotonic time of the last PCM chunk
+        self._first_audio = 0.0  # monotonic time of the utterance's first chunk
+        self._bytes_pumped = 0  # PCM bytes pumped for the current utterance
+
+    def _ensure(self):
+        """(Re)start the pipeline if it is not running."""
+        if self._piper is not None and self._piper.poll() is None:
+            return
+        self._piper = subprocess.Popen(
+            [Config.PIPER_PATH, "-m", Config.PIPER_MODEL, "-c", Config.PIPER_CONFIG,
+             "--output-raw", "--json-input"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL, bufsize=0)
+        self._aplay = subprocess.Popen(
+            ["aplay", "-q", "-r", "22050", "-f", "S16_LE", "-t", "raw", "-D", Config.AUDIO_DEVICE],
+            stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        threading.Thread(target=self._pump, args=(self._piper, self._aplay),
+                         daemon=True, name="PiperPump").start()
+
+    def _pump(self, piper, aplay):
+        """Copy PCM from Piper to aplay, timestamping the flow."""
+        try:
+            while True:
+                chunk = piper.stdout.read(4096)
+                if not chunk:
+                    break
+                if not self._first_audio:
+                    self._first_audio = time.monotonic()
+                self._bytes_pumped += len(chunk)
+                self._last_audio = time.monotonic()
+                aplay.stdin.write(chunk)
+        except Exception:
+            pass  # Pipeline died; _ensure() restarts it on the next speak
+
+    def warm(self):
+        """Start the pipeline early so the ONNX voice-model load happens
+        during startup instead of delaying the first reply."""
+        with self._lock:
+            try:
+                self._ensure()
+            except Exception as e:
+                print(f"[AI] Piper pre-load warning: {e}")
+
+    def speak(self, text):
+        """Synthesize and play `text`, blocking until playback finishes."""
+        with self._lock:
+            try:
+                self._ensure()
+                start = time.monotonic()
+                self._last_audio = 0.0
+                self._first_audio = 0.0
+                self._bytes_pumped = 0
+                # Feed one sentence per line so playback of sentence N
+                # overlaps synthesis of sentence N+1
+                for sentence in _SENTENCE_SPLIT_RE.split(text):
+                    sentence = sentence.strip()
+                    if sentence:
+                        payload = json.dumps({"text": sentence}) + "\n"
+                        self._piper.stdin.write(payload.encode("utf-8"))
+                        self._piper.stdin.flush()
+                while True:
+                    now = time.monotonic()
+                    last = self._last_audio
+                    if last and (now - last) > self._QUIET_SEC:
+                        # Synthesis is done, but the pipe and ALSA buffer
+                        # may still hold seconds of audio: only return
+                        # once the playback clock (bytes / PCM rate from
+                        # the first chunk) has run out too, so the mic
+                        # never reopens while the robot is mid-sentence
+                        playback_end = (self._first_audio +
+                                        self._bytes_pumped / self._BYTES_PER_SEC)
+                        if now >= playback_end:
+                            break
+                    if not last and (now - start) > self._NO_AUDIO_SEC:
+                        break
+                    time.sleep(0.05)
+            except Exception as e:
+                print(f"Error during speech generation/playback: {e}")
+                self.close()
+
+    def close(self):
+        """Tear the pipeline down; the next speak() rebuilds it."""
+        for proc in (self._piper, self._aplay):
+            try:
+                if proc:
+                    proc.kill()
+            except Exception:
+                pass
+        self._piper = None
+        self._aplay = None
+
+
+_piper_engine = _PiperEngine()
+
+
 def speak_and_animate(app, text_to_speak, emotion='neutral'):
     """
     Generates speech using Piper and plays it, while animating the face and LEDs.
-    
+
     Args:
         app (MarichFaceApp): The GUI application instance.
         text_to_speak (str): The text to be synthesized into speech.
@@ -107,22 +476,12 @@ def speak_and_animate(app, text_to_speak, emotion='neutral'):
     # because the threaded scared_led_sequence is handling it.
     if emotion != 'scared':
         set_emotion_led(emotion) # Control LEDs based on emotion
-    
-    try:
-        subprocess.run(
-            [Config.PIPER_PATH, "-m", Config.PIPER_MODEL, "-c", Config.PIPER_CONFIG, "--output_file", Config.TEMP_WAV_FILE],
-            input=text_to_speak.encode("utf-8"), check=True, capture_output=True)
 
-        app.root.after(0, app.start_talking)
-        play_proc = subprocess.Popen(["aplay", "-D", Config.AUDIO_DEVICE, Config.TEMP_WAV_FILE], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        play_proc.wait()
-
-    except Exception as e:
-        print(f"Error during speech generation/playback: {e}")
+    app.root.after(0, app.start_talking)
+    try:
+        _piper_engine.speak(text_to_speak)
     finally:
         app.root.after(0, app.stop_talking)
-        if os.path.exists(Config.TEMP_WAV_FILE):
-            os.remove(Config.TEMP_WAV_FILE)
 
 # --- Main Chatbot Logic Thread ---
 def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial_greeting: bool = False):
@@ -133,11 +492,18 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         stop_event: threading.Event set to request graceful stop.
         suppress_initial_greeting: skip first hello if True.
     """
-    global conversation_history, motor_timer
+    global motor_timer  # conversation_history is mutated in place, never rebound
     if stop_event is None:
         stop_event = threading.Event()
+    # Register our stopper so big_main can stop us without importing us
+    stop_registry.register("chatbot", stop_event.set)
     pat_timer = None
 
+    # Keep the LLM pinned in memory for the whole session
+    if _OLLAMA_OK and ollama is not None:
+        threading.Thread(target=_keep_alive_watchdog, args=(stop_event,),
+                         daemon=True, name="OllamaKeepAlive").start()
+
     try:
         bot = Raspbot()
         bot.Ctrl_Ulatist_Switch(1) # Turn on the ultrasonic sensor
@@ -146,6 +512,14 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         print(f"[AI] Warning: Could not initialize Raspbot hardware for sensors: {e}")
         bot = None # Set to None so we can check later
 
+    # Sensor events, posted by the dedicated polling thread below
+    highfive_event = threading.Event()
+    scared_event = threading.Event()
+    if bot:
+        threading.Thread(target=_sensor_poll_loop,
+                         args=(bot, highfive_event, scared_event, stop_event),
+                         daemon=True, name="SensorPollThread").start()
+
     time.sleep(1)
     if not suppress_initial_greeting:
         speak_and_animate(app, "Hello! My name is Marich.", 'happy')
@@ -163,8 +537,7 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         set_emotion_led('shy')
         
         # Cancel previous timer if it exists to reset the duration
-        if pat_timer and pat_timer.is_alive():
-            pat_timer.cancel()
+        _timers.cancel(pat_timer)
         
         # Define what happens when the timer finishes
         def revert_to_neutral():
@@ -174,9 +547,8 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
                 app.root.after(0, lambda: app.set_emotion('neutral'))
                 set_emotion_led('neutral')
 
-        # Start a timer to revert to the neutral state after 2 seconds
-        pat_timer = threading.Timer(2.0, revert_to_neutral)
-        pat_timer.start()
+        # Revert to the neutral state after 2 seconds
+        pat_timer = _timers.call_later(2.0, revert_to_neutral)
 
     def handle_tap_effect():
         """Triggers the hardware buzzer."""
@@ -189,27 +561,77 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
     SetLogLevel(-1) # Hide Vosk log messages
     try:
         p = pyaudio.PyAudio()
-        vosk_model = Model(Config.VOSK_MODEL_PATH)
-        recognizer = KaldiRecognizer(vosk_model, 16000)
+        # Reuse the model preload_model() already faulted into RAM
+        vosk_model = _vosk_model if _vosk_model is not None else Model(Config.VOSK_MODEL_PATH)
+        # Closed-grammar recognizer for the fixed command set: Vosk compiles
+        # the phrase list into a tiny FST, so decoding a command costs tens
+        # of ms instead of a full open-vocabulary beam search. [unk] lets it
+        # flag out-of-grammar speech instead of force-matching a command.
+        command_grammar = json.dumps(list(MOVEMENT_COMMANDS.keys()) + [
+            "dance", "party", "let's dance", "stop", "help", "options",
+            "goodbye", "bye", "by", "exit", "quit", "move square", "car patrol",
+            "[unk]"
+        ])
+        recognizer = KaldiRecognizer(vosk_model, 16000, command_grammar)
+        # Open-vocabulary recognizer, used only to re-decode utterances the
+        # grammar flags as out-of-grammar (i.e. LLM questions)
+        open_recognizer = KaldiRecognizer(vosk_model, 16000)
+        # We only ever read the plain 'text' field, so skip per-word
+        # timestamps, partial-word metadata and n-best lists - each costs
+        # decoder CPU on every frame for output nobody consumes.
+        try:
+            for rec in (recognizer, open_recognizer):
+                rec.SetWords(False)
+                rec.SetPartialWords(False)
+                rec.SetMaxAlternatives(0)
+        except Exception:
+            pass  # Older Vosk builds without these setters
     except Exception as e:
         print(f"Error: Could not initialize speech recognition. Check Vosk model path and PyAudio setup. Details: {e}")
         return
 
-    movement_commands = {
-        "move forward": move_forward, "move back": move_backward, "move backward": move_backward,
-        "move right": move_right, " moveleft": move_left, "turn right": rotate_right, "turn left": rotate_left,
-        "move front left": move_diagonal_left_front, "move front right": move_diagonal_right_front,
-        "move back left": move_diagonal_left_back, "move back right": move_diagonal_right_back
-    }
+    # One persistent capture stream for the whole session: re-opening the
+    # ALSA device every turn paid device-init latency (and a Vosk warm-up
+    # transient) per cycle. Listening phases just stop/start the stream.
+    #
+    # The stream runs in callback mode: PortAudio's thread pushes each
+    # 30 ms chunk into a queue and the loop below reads it with a 50 ms
+    # timeout, so stop_event and sensor flags are checked on a steady
+    # cadence instead of only between blocking stream.read calls.
+    stream = None
+    audio_q = queue.Queue(maxsize=32)
+
+    def _capture_cb(in_data, frame_count, time_info, status):
+        try:
+            audio_q.put_nowait(in_data)
+        except queue.Full:
+            pass  # Consumer stalled; drop rather than block the audio thread
+        return (None, pyaudio.paContinue)
 
-    while not stop_event.is_set():
+    def pause_stream():
+        """Stop capture, dropping whatever is buffered (e.g. our own TTS)."""
         try:
-            stream = p.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True, frames_per_buffer=8192)
-        except Exception as e:
-            print(f"Error: Failed to open audio stream. Is the microphone connected? Details: {e}")
-            time.sleep(5)
-            continue
-            
+            stream.stop_stream()
+        except Exception:
+            pass
+        try:
+            while True:
+                audio_q.get_nowait()
+        except queue.Empty:
+            pass
+
+    while not stop_event.is_set():
+        if stream is None:
+            try:
+                stream = p.open(format=pyaudio.paInt16, channels=1, rate=16000, input=True,
+                                frames_per_buffer=480, stream_callback=_capture_cb)
+            except Exception as e:
+                print(f"Error: Failed to open audio stream. Is the microphone connected? Details: {e}")
+                time.sleep(5)
+                continue
+        elif stream.is_stopped():
+            stream.start_stream()
+
         print("\nListening...")
         if app.current_emotion not in ['shy', 'scared']: # Don't override special states
             app.root.after(0, lambda: app.set_emotion('neutral'))
@@ -218,93 +640,76 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         text = ""
 
         action_triggered = False      # Flag to break out after an action
-        last_sensor_check_time = 0.0  # For throttling sensor reads
-        high_five_state = "idle"      # State for high-five logic ("idle", "approached")
-        approached_time = 0.0
+        utt_frames = []               # Current utterance, kept for re-decode
+        in_speech = False             # VAD state: inside an utterance?
+        preroll = collections.deque(maxlen=4)  # ~120ms kept before onset
 
         # --- THIS IS THE FIXED INNER LOOP ---
         while not stop_event.is_set():
-            data = stream.read(4096, exception_on_overflow=False)
-            
-            # --- SENSOR CHECKS (High-Five & Scared) ---
-            # All sensor logic is now INSIDE the audio loop
-            now = time.time()
-            # Check sensors 10 times per second (100ms interval)
-            if bot and (now - last_sensor_check_time > 0.1):
-                last_sensor_check_time = now
-
-                # 1. High-Five Logic (Ultrasonic)
-                try:
-                    # Read 2-byte distance from registers 0x1b (High) and 0x1a (Low)
-                    # --- FIX: Check if data is valid before indexing ---
-                    data_H = bot.read_data_array(0x1b, 1)
-                    data_L = bot.read_data_array(0x1a, 1)
-                    
-                    if data_H and data_L:
-                        diss_H = data_H[0]
-                        diss_L = data_L[0]
-                        distance_mm = (diss_H << 8) | diss_L
-                    else:
-                        distance_mm = 999 # Set a default high distance if read fails
-                    # --- END FIX ---
-
-                    if high_five_state == "idle" and distance_mm < 120: # Hand approached
-                        high_five_state = "approached"
-                        approached_time = now
-                    elif high_five_state == "approached":
-                        if distance_mm > 170: # Hand receded
-                            if (now - approached_time) < 1.0: # Check if it was fast (under 1 sec)
-                                print("[AI] High Five!")
-                                stream.stop_stream()
-                                stream.close()
-                                speak_and_animate(app, "High five!", 'happy')
-                                high_five_state = "idle"
-                                action_triggered = True
-                                break # Exit inner loop
-                            else:
-                                high_five_state = "idle" # Too slow, reset
-                        elif (now - approached_time) > 1.5: # Hand held too long, reset
-                            high_five_state = "idle"
-                except Exception:
-                    pass # Ignore I2C errors
-
-                # 2. Scared Logic (Line Tracker)
-                try:
-                    # Read the 4-bit sensor data from register 0x0a
-                    # --- FIX: Check if data is valid before indexing ---
-                    track_data = bot.read_data_array(0x0a, 1)
-                    
-                    if track_data:
-                        track = track_data[0]
-                    else:
-                        track = 0 # Set a default of 0 (on ground) if read fails
-                    # --- END FIX ---
-
-                    # Check if all 4 bits are 1 (0x0F = 15)
-                    # This means all sensors see "white" / no ground
-                    if (track & 0x0F) == 0x00:
-                        print("[AI] Ahh! Picked up!")
-                        stream.stop_stream()
-                        stream.close()
-                        
-                        # --- FIX: Launch new 'scared' reaction ---
-                        # 1. Start the flashing red LED sequence in a non-blocking thread
-                        threading.Thread(target=scared_led_sequence, daemon=True).start()
-                        
-                        # 2. Call speak_and_animate with the new 'scared' emotion and text
-                        speak_and_animate(app, "Whoa! Put me down! I'm scared!", 'scared')
-                        
-                        action_triggered = True
-                        break # Exit inner loop
-                        # --- END FIX ---
-                except Exception:
-                    pass # Ignore I2C errors
+            try:
+                data = audio_q.get(timeout=0.05)
+            except queue.Empty:
+                data = None  # No audio yet; still run the checks below
+
+            # --- SENSOR CHECKS (posted by the sensor thread) ---
+            # The I2C polling itself lives in _sensor_poll_loop; here we
+            # only check flags, so the ASR path never waits on the bus
+            if highfive_event.is_set():
+                highfive_event.clear()
+                print("[AI] High Five!")
+                pause_stream()
+                speak_and_animate(app, "High five!", 'happy')
+                action_triggered = True
+                break # Exit inner loop
+
+            if scared_event.is_set():
+                scared_event.clear()
+                print("[AI] Ahh! Picked up!")
+                pause_stream()
+
+                # 1. Start the flashing red LED sequence in a non-blocking thread
+                threading.Thread(target=scared_led_sequence, daemon=True).start()
+
+                # 2. Call speak_and_animate with the 'scared' emotion and text
+                speak_and_animate(app, "Whoa! Put me down! I'm scared!", 'scared')
+
+                action_triggered = True
+                break # Exit inner loop
             # --- END SENSOR CHECKS ---
 
             # --- SPEECH RECOGNITION (Now correctly indented) ---
+            if data is None:
+                continue
+            # Cheap VAD gate: skip the Kaldi acoustic model on pure
+            # silence - it dominates idle CPU otherwise. Once speech
+            # starts, every chunk (pauses included) is fed so Vosk's own
+            # endpointing can finalize the utterance; the preroll keeps
+            # the ~120ms before onset so word starts aren't clipped.
+            if audioop is not None and not in_speech:
+                if audioop.rms(data, 2) < _SILENCE_RMS:
+                    preroll.append(data)
+                    continue
+                in_speech = True
+                for held in preroll:
+                    utt_frames.append(held)
+                    recognizer.AcceptWaveform(held)
+                preroll.clear()
+            utt_frames.append(data)
             if recognizer.AcceptWaveform(data):
                 result = json.loads(recognizer.Result())
                 text = result.get('text', '').strip()
+                if text and not text.replace('[unk]', '').strip():
+                    # Out-of-grammar speech (an LLM question): re-decode the
+                    # buffered utterance with the open-vocabulary recognizer
+                    for chunk in utt_frames:
+                        open_recognizer.AcceptWaveform(chunk)
+                    text = json.loads(open_recognizer.FinalResult()).get('text', '').strip()
+                    try:
+                        open_recognizer.Reset()
+                    except Exception:
+                        pass
+                utt_frames.clear()
+                in_speech = False  # Re-arm the VAD gate for the next utterance
                 if text: break
         # --- END OF THE FIXED INNER LOOP ---
 
@@ -314,27 +719,30 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         # If a sensor action was triggered, skip the rest and restart the listening loop
         if action_triggered:
             app.root.after(0, app.disable_touch) # Make sure to disable touch
-            # stream is already closed, so we just continue to the top of the outer loop
+            # stream is already paused; the top of the outer loop restarts it
             continue
 
         # This code is only reached if speech was detected (action_triggered = False)
         app.root.after(0, app.disable_touch)
-        stream.stop_stream()
-        stream.close()
+        pause_stream()
         if not text: continue
 
         print(f"You: {text}")
         user_command = text.lower()
+        # Tokenize once; single-word intents below use O(1) set membership
+        # instead of re-scanning the string (and unlike substring tests,
+        # "stop" no longer matches inside words like "nonstop")
+        tokens = frozenset(user_command.split())
         
         # --- Command Handling ---
         # Handle "dance" command first
-        if any(word in user_command for word in ["dance", "party", "let's dance"]):
+        if _DANCE_RE.search(user_command):
             speak_and_animate(app, "Okay, time to party!", 'happy')
             dance_routine()
             continue
 
         # Handle "square" command first
-        if any(word in user_command for word in ["move square", "car patrol"]):
+        if _PATROL_RE.search(user_command):
             speak_and_animate(app, "moving in a square", 'happy')
             car_patrol()
             continue
@@ -342,31 +750,31 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         car_moved = False
         speed = 50
 
-        if "stop" in user_command:
+        if "stop" in tokens:
             stop_car()
             speak_and_animate(app, "Stopping.", 'neutral')
             continue
-        
-        if "help" in user_command or "options" in user_command:
+
+        if _HELP_RE.search(user_command):
             help_text = "You can ask me to go forward, back, left, or right. You can also say turn left or turn right."
             speak_and_animate(app, help_text, 'neutral')
             continue
 
-        for command, function in movement_commands.items():
-            if command in user_command:
-                set_movement_led() # Set LEDs to yellow for movement
-                function(speed)
-                speak_and_animate(app, f"Okay, {command}.", 'neutral')
-                car_moved = True
-                break
-        
+        move_match = _MOVEMENT_RE.search(user_command)
+        if move_match:
+            command = move_match.group(1)
+            set_movement_led() # Set LEDs to yellow for movement
+            MOVEMENT_COMMANDS[command](speed)
+            speak_and_animate(app, f"Okay, {command}.", 'neutral')
+            car_moved = True
+
         if car_moved:
-            if motor_timer and motor_timer.is_alive(): motor_timer.cancel()
-            motor_timer = threading.Timer(0.5, stop_car)
-            motor_timer.start()
+            with MOTOR_TIMER_LOCK:
+                _timers.cancel(motor_timer)
+                motor_timer = _timers.call_later(0.5, stop_car)
             continue
 
-        if user_command in ["goodbye", "bye", "by", "exit", "quit"]:
+        if user_command in _EXIT_COMMANDS:
             stop_car()
             speak_and_animate(app, "Goodbye!", 'happy')
             time.sleep(2)
@@ -375,35 +783,88 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
             app.root.after(0, app.root.quit)
             break
         
+        # --- Canned small-talk (no LLM round trip) ---
+        canned = CANNED_RESPONSES.get(user_command)
+        if canned:
+            speak_and_animate(app, canned[0], canned[1])
+            continue
+
         # --- Chatbot LLM Logic ---
         print("Marich is thinking...")
-        conversation_history.append({'role': 'user', 'content': text})
-        
+        with HISTORY_LOCK:
+            conversation_history.append({'role': 'user', 'content': text})
+            # Snapshot for the LLM call so the lock isn't held for the
+            # seconds the model needs to respond
+            messages = list(conversation_history)
+
+        speech_thread = None
         if not _OLLAMA_OK or ollama is None:
             print('[AI] Ollama unavailable:', _OLLAMA_ERR)
             speech_text = "Chat model not installed."
             emotion = 'angry'
-            conversation_history.append({'role': 'assistant', 'content': json.dumps({'text': speech_text, 'emotion': emotion})})
+            assistant_content = json.dumps({'text': speech_text, 'emotion': emotion})
         else:
             try:
-                # Use the model (it stays loaded in memory after first use)
-                response = ollama.chat(model=Config.LLM_MODEL, messages=conversation_history, format='json')
-                
-                ai_response_json = json.loads(response['message']['content'])
+                # Stream the response token by token: speech starts the
+                # moment the JSON "text" field closes, overlapping TTS with
+                # the emotion/closing-brace tail the model is still
+                # generating - instead of sitting silent until the full
+                # response has been decoded.
+                buf = ''
+                for chunk in OLLAMA_CLIENT.chat(model=Config.LLM_MODEL, messages=messages, format='json',
+                                                stream=True, keep_alive=Config.OLLAMA_KEEP_ALIVE,
+                                                options=_OLLAMA_OPTIONS):
+                    buf += chunk['message']['content']
+                    if speech_thread is None:
+                        text_match = _LLM_TEXT_RE.search(buf)
+                        if text_match:
+                            # Un-escape via json.loads on the quoted span
+                            speech_text = json.loads('"' + text_match.group(1) + '"')
+                            speech_thread = threading.Thread(
+                                target=speak_and_animate, args=(app, speech_text, 'neutral'),
+                                daemon=True, name="EarlySpeech")
+                            speech_thread.start()
+
+                ai_response_json = json.loads(buf)
                 speech_text = ai_response_json.get('text', "I'm not sure how to respond.")
                 emotion = ai_response_json.get('emotion', 'neutral').lower()
                 if emotion not in Config.EMOTION_COLORS: emotion = 'neutral'
-                conversation_history.append({'role': 'assistant', 'content': response['message']['content']})
+                assistant_content = buf
             except Exception as e:
                 print(f"LLM response parsing error: {e}")
                 speech_text = "I seem to have gotten my wires crossed."
                 emotion = 'angry'
-                conversation_history.append({'role': 'assistant', 'content': json.dumps({'text': speech_text, 'emotion': emotion})})
-        
-        if len(conversation_history) > 7:
-            conversation_history = [conversation_history[0]] + conversation_history[-6:]
-            
-        speak_and_animate(app, speech_text, emotion)
+                assistant_content = json.dumps({'text': speech_text, 'emotion': emotion})
+
+        # Bound the prefix by approximate tokens rather than turn count:
+        # six long messages can still be a huge prefill, and on CPU-only
+        # Ollama the time-to-first-token scales with prefix length. The
+        # ~4-chars-per-token heuristic is plenty for a budget check.
+        with HISTORY_LOCK:
+            conversation_history.append({'role': 'assistant', 'content': assistant_content})
+            dropped = []
+            while (sum(len(m['content']) // 4 for m in conversation_history) > 512
+                   and len(conversation_history) > 3):
+                # Pop the oldest user/assistant pair (index 0 is the system msg)
+                dropped.extend(conversation_history[1:3])
+                del conversation_history[1:3]
+            if dropped:
+                # Fold what the user said into a short [earlier] note on the
+                # system message so the bot keeps a trace of the conversation
+                earlier = ' / '.join(m['content'][:60] for m in dropped if m['role'] == 'user')
+                base = conversation_history[0]['content'].split('\n[earlier]: ')[0]
+                conversation_history[0]['content'] = base + '\n[earlier]: ' + earlier[:300]
+
+        if speech_thread is not None:
+            # Speech already started mid-stream with a neutral face; apply
+            # the real emotion now that the tail has been parsed, then wait
+            # for playback so the loop doesn't start listening over it
+            app.root.after(0, lambda: app.set_emotion(emotion))
+            if emotion != 'scared':
+                set_emotion_led(emotion)
+            speech_thread.join()
+        else:
+            speak_and_animate(app, speech_text, emotion)
 
     # Cleanup before exiting thread
     try:
@@ -420,6 +881,7 @@ def run_chatbot(app, stop_event: threading.Event | None = None, suppress_initial
         p.terminate()
     except Exception:
         pass
+    stop_registry.unregister("chatbot")
     print("[AI] Chatbot thread exiting.")
 
 def request_stop(stop_event: threading.Event | None):
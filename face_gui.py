@@ -4,22 +4,33 @@
 # including the face's drawing, state, and animations.
 
 import tkinter as tk
+import functools
 import os
 import math
 import random
+import threading
 import time
 from typing import Optional
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # Starfield falls back to per-star Python math
+
 # NEW: Added PIL for image display on Tkinter canvas
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageTk, ImageDraw
+    _PIL_OK = True
 except ImportError:
     print("Warning: Pillow (PIL) is not installed. Game images will not display.")
+    _PIL_OK = False
+    ImageDraw = None # type: ignore
     class Image: # type: ignore
         @staticmethod
         def open(path): return None
         class Resampling: # type: ignore
             LANCZOS = 1
+            BILINEAR = 2
     class ImageTk: # type: ignore
         @staticmethod
         def PhotoImage(img): return None
@@ -31,16 +42,29 @@ class Config:
     _BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     
     VOSK_MODEL_PATH = os.path.join(_BASE_DIR, "vosk-model-small-en-us-0.15")
-    LLM_MODEL = "gemma2:2b" 
+    LLM_MODEL = "gemma2:2b"
+    # Keep the LLM weights resident between turns (-1 = never unload).
+    # Ollama otherwise evicts idle models after ~5 min, so the first query
+    # after a quiet spell would pay the full multi-second cold load again.
+    OLLAMA_KEEP_ALIVE = -1
     PIPER_PATH = os.path.join(_BASE_DIR, "piper", "piper")
     PIPER_MODEL = os.path.join(_BASE_DIR, "piper", "en_US-amy-medium.onnx")
     PIPER_CONFIG = os.path.join(_BASE_DIR, "piper", "en_US-amy-medium.onnx.json")
     AUDIO_DEVICE = "default" # TODO: Verify this with `arecord -l`
-    TEMP_WAV_FILE = "piper_output.wav"
+    # Scratch WAV for any tool that still wants file-based TTS output. The
+    # chatbot streams Piper straight to aplay and never touches this, but
+    # keep it on tmpfs so a stray write stays in RAM instead of wearing
+    # the SD card.
+    TEMP_WAV_FILE = "/dev/shm/piper_output.wav" if os.path.isdir("/dev/shm") else "piper_output.wav"
     CANVAS_WIDTH = 300
     CANVAS_HEIGHT = 300
     STAR_COLOR = "#e0e0e0"
     NUM_STARS = 75
+    # Animation frame rates. The loops subtract each frame's own draw
+    # time from the next after() delay, so these are real targets rather
+    # than "fixed delay + however long drawing took".
+    IDLE_FPS = 20
+    TALK_FPS = 40
     EMOTION_COLORS = {
         'neutral': "#1a1a2e",
         'happy': "#16a085",
@@ -61,6 +85,13 @@ class Config:
     RPS_SCISSORS_PATH = os.path.join(_BASE_DIR, "scissors.png")
 
 
+@functools.lru_cache(maxsize=16)
+def _emotion_bg(emotion):
+    """Emotion name -> canvas background color, memoized so repeated
+    set_emotion calls never re-run the lookup-with-fallback."""
+    return Config.EMOTION_COLORS.get(emotion, Config.EMOTION_COLORS['neutral'])
+
+
 # --- Main GUI Application Class ---
 class MarichFaceApp:
     """
@@ -85,7 +116,8 @@ class MarichFaceApp:
         self.touch_enabled = False
         self.pat_callback = None
         self.tap_callback = None 
-        self.last_pat_time = 0
+        self._last_pat_ms = 0  # X-server timestamp of the last accepted pat
+        self._pat_pending = False  # A pat drain callback is scheduled
         self.canvas.bind("<Button-1>", self._handle_tap)
         self.canvas.bind("<B1-Motion>", self._handle_pat)
 
@@ -93,11 +125,43 @@ class MarichFaceApp:
         self.face_parts = {}
         self.initial_coords = {}
         self.background_stars = []
+        self._bg_item = None   # Single scrolled starfield image (PIL path)
+        self._scroll_y = 0.0
+        # Last integer-pixel coords actually written per face part, used
+        # to skip canvas.coords calls that wouldn't move anything
+        self._last_applied_coords = {}
+        # Accumulated whole-pixel bob applied via canvas.move to every
+        # non-pupil face part; zeroed whenever parts are repositioned
+        self._last_bob = (0, 0)
+        # Tcl name of the canvas widget, for batched eval scripts
+        self._cw = str(self.canvas)
+        self._cached_base_mouth = None  # Mouth rest coords, set by draw_face
+        self._anim_after_id = None      # Pending after() id of the mouth loop
+        self._pupil_max_offset = {}     # Pupil travel limits, set per emotion
+        self._idle_after_id = None      # Pending after() id of the idle loop
+
+        # Trig lookup tables, amplitudes baked in: the drift phases are
+        # periodic in idle_step, so four libm calls per frame become four
+        # list indexings. idle_step wraps at 600 frames (~30 s);
+        # sin(600/10) isn't exactly sin(0), but the seam is sub-pixel.
+        self._bob_sin = [1.5 * math.sin(i / 10) for i in range(600)]
+        self._bob_cos = [1.0 * math.cos(i / 10) for i in range(600)]
+        self._pupil_sin = [math.sin(i / 15) for i in range(600)]
+        self._pupil_cos = [math.cos(i / 20) * 0.7 for i in range(600)]
+        # Mouth openness factor; exact, since animation_step wraps at 20
+        self._mouth_f = [(math.sin(math.pi * i / 10) + 1) / 2 for i in range(20)]
         
         # --- NEW: Game Image State ---
         self.current_game_image: Optional[tk.PhotoImage] = None
+        self._game_img_item = None  # Persistent canvas item reused per move
         # Cache PhotoImage objects to prevent garbage collection
         self.image_cache: dict = {}
+        # Pre-decoded, pre-resized PIL images filled by a background
+        # thread so the first display never decodes on the Tk thread
+        self._raw_cache: dict = {}
+        if _PIL_OK:
+            threading.Thread(target=self._prewarm_images, daemon=True,
+                             name="ImagePrewarm").start()
 
         self._define_face_coords()
         self._create_starfield()
@@ -139,65 +203,191 @@ class MarichFaceApp:
 
     def _create_starfield(self):
         """Populates the background with stars for a dynamic effect."""
+        if _PIL_OK:
+            # Render the whole starfield once into an RGBA image tiled
+            # twice vertically; scrolling is then one coords call on one
+            # item per frame, regardless of star count. The transparent
+            # background lets the emotion color of the canvas show
+            # through, so set_emotion keeps working unchanged.
+            w, h = Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT
+            tile = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(tile)
+            for _ in range(Config.NUM_STARS):
+                x, y = random.randrange(w), random.randrange(h)
+                s = random.randint(1, 2)
+                draw.ellipse((x, y, x + s, y + s), fill=Config.STAR_COLOR)
+            bg = Image.new("RGBA", (w, 2 * h), (0, 0, 0, 0))
+            bg.paste(tile, (0, 0))
+            bg.paste(tile, (0, h))
+            self._bg_photo = ImageTk.PhotoImage(bg)  # Keep a ref or Tk drops it
+            self._bg_item = self.canvas.create_image(0, 0, anchor=tk.NW,
+                                                     image=self._bg_photo)
+            return
+        if np is not None:
+            # SoA layout: all positions in one float32 array so each idle
+            # tick updates every star with a couple of vectorized ops
+            # instead of 75 rounds of Python float math + coords reads
+            n = Config.NUM_STARS
+            self.star_xy = np.empty((n, 2), dtype=np.float32)
+            self.star_xy[:, 0] = np.random.uniform(0, Config.CANVAS_WIDTH, n)
+            self.star_xy[:, 1] = np.random.uniform(0, Config.CANVAS_HEIGHT, n)
+            self.star_sizes = np.random.uniform(0.5, 2, n).astype(np.float32)
+            self._star_wrap = np.array([Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT],
+                                       dtype=np.float32)
+            self.star_ids = [
+                self.canvas.create_oval(x, y, x + s, y + s,
+                                        fill=Config.STAR_COLOR, outline="")
+                for (x, y), s in zip(self.star_xy, self.star_sizes)
+            ]
+            return
+        self._star_pos = []  # [x, y, size] per star; Tk is never queried
         for _ in range(Config.NUM_STARS):
             x = random.uniform(0, Config.CANVAS_WIDTH)
             y = random.uniform(0, Config.CANVAS_HEIGHT)
             size = random.uniform(0.5, 2)
             star = self.canvas.create_oval(x, y, x + size, y + size, fill=Config.STAR_COLOR, outline="")
             self.background_stars.append(star)
+            self._star_pos.append([x, y, size])
+
+    # Transient parts are rebuilt on every emotion change (the mouth even
+    # changes item type); eyes, pupils and lids persist and only move.
+    _TRANSIENT_PARTS = ('mouth', 'left_cheek', 'right_cheek',
+                        'left_eyebrow', 'right_eyebrow')
 
     def draw_face(self):
-        """Clears and redraws all facial features based on the current emotion."""
-        self.canvas.delete("face_part", "game_image") # MODIFIED: Also clear game images
-        self.face_parts.clear()
-        self.initial_coords.clear()
-        
-        # NEW: If a game image is set, display it and stop drawing the face
+        """Redraws the face (or game image) for the current emotion."""
+        # NEW: If a game image is set, hide the face and show the image.
+        # The image item is persistent: switching between rock, paper and
+        # scissors is an itemconfig image swap on one item id rather than
+        # delete + create churn for every move shown.
         if self.current_game_image:
-            self.canvas.create_image(Config.CANVAS_WIDTH/2, Config.CANVAS_HEIGHT/2,
-                                     anchor=tk.CENTER, image=self.current_game_image, tags="game_image")
+            self.canvas.itemconfig("face_part", state=tk.HIDDEN)
+            if self._game_img_item is None or not self.canvas.find_withtag("game_image"):
+                self._game_img_item = self.canvas.create_image(
+                    Config.CANVAS_WIDTH/2, Config.CANVAS_HEIGHT/2,
+                    anchor=tk.CENTER, image=self.current_game_image, tags="game_image")
+            else:
+                self.canvas.itemconfig(self._game_img_item,
+                                       image=self.current_game_image, state=tk.NORMAL)
             return
+        if self._game_img_item is not None:
+            self.canvas.itemconfig(self._game_img_item, state=tk.HIDDEN)
+        self._ensure_persistent_items()
+        self._apply_emotion()
+
+    def _ensure_persistent_items(self):
+        """Create the long-lived face items (eyes, pupils, lids) once.
+
+        Rebuilds from scratch only on the first draw or after an external
+        cleanup wiped the canvas; every other emotion change reuses these
+        item ids and just moves them, avoiding Tcl item churn.
+        """
+        if self.face_parts.get('left_eye') and self.canvas.find_withtag('face_part'):
+            return
+        self.canvas.delete("face_part")
+        self.face_parts.clear()
+        self.initial_coords.clear()
+        self._last_applied_coords.clear()
+        self._last_bob = (0, 0)
 
-        coords = self.base_coords.get(self.current_emotion, self.base_coords['neutral'])
-
-        # Eyes and Pupils
+        coords = self.base_coords['neutral']
         for eye_type in ['left_eye', 'right_eye']:
             L = coords[eye_type]
             pupil_size = 15
             px, py = (L[0] + L[2]) / 2, (L[1] + L[3]) / 2
-            
+
             eye_id = self.canvas.create_oval(*L, fill=Config.FACE_COLOR, outline="", tags="face_part")
             pupil_id = self.canvas.create_oval(px-pupil_size/2, py-pupil_size/2, px+pupil_size/2, py+pupil_size/2,
                                                fill=Config.PUPIL_COLOR, outline="", tags="face_part")
+            # The blink lid is created up front and hidden: blinking then
+            # only flips item state instead of deleting and re-creating
+            # canvas items every few seconds for the whole session
+            lid_id = self.canvas.create_line(L[0], py, L[2], py, fill=Config.PUPIL_COLOR,
+                                             width=6, state=tk.HIDDEN, tags="face_part")
             self.face_parts[eye_type] = eye_id
             self.face_parts[f'{eye_type}_pupil'] = pupil_id
+            self.face_parts[f'{eye_type}_lid'] = lid_id
 
-        # Mouth, Eyebrows, Cheeks
+    def _apply_emotion(self):
+        """Reshape the persistent items and rebuild only the transient ones."""
+        coords = self.base_coords.get(self.current_emotion, self.base_coords['neutral'])
+        # Cache the mouth rest coords here (the only place emotion can
+        # take effect) so _animate_mouth skips two dict lookups per tick
+        self._cached_base_mouth = coords.get('mouth')
+        self._last_applied_coords.clear()
+        # Everything below is written at its rest position, so the
+        # accumulated canvas.move bob starts over from zero
+        self._last_bob = (0, 0)
+
+        # Eyes, pupils and lids: move in place. Rest coordinates are
+        # recorded as they are written - we just computed them, so asking
+        # Tk to read them back would be a wasted round trip per item
+        for eye_type in ['left_eye', 'right_eye']:
+            L = coords[eye_type]
+            pupil_size = 15
+            px, py = (L[0] + L[2]) / 2, (L[1] + L[3]) / 2
+            self.canvas.coords(self.face_parts[eye_type], *L)
+            self.canvas.coords(self.face_parts[f'{eye_type}_pupil'],
+                               px-pupil_size/2, py-pupil_size/2, px+pupil_size/2, py+pupil_size/2)
+            self.canvas.coords(self.face_parts[f'{eye_type}_lid'], L[0], py, L[2], py)
+            self.initial_coords[eye_type] = list(L)
+            self.initial_coords[f'{eye_type}_pupil'] = [
+                px-pupil_size/2, py-pupil_size/2, px+pupil_size/2, py+pupil_size/2]
+            self.initial_coords[f'{eye_type}_lid'] = [L[0], py, L[2], py]
+
+        # Mouth, Eyebrows, Cheeks: emotion-specific, so rebuilt each time
+        self.canvas.delete("transient")
+        for name in self._TRANSIENT_PARTS:
+            self.face_parts.pop(name, None)
+            self.initial_coords.pop(name, None)
+        tags = ("face_part", "transient")
         if self.current_emotion in ['happy', 'shy']:
-            self.face_parts['mouth'] = self.canvas.create_arc(*coords['mouth'], start=0, extent=-180, style=tk.CHORD, fill=Config.MOUTH_COLOR, outline="", tags="face_part")
-            self.face_parts['left_cheek'] = self.canvas.create_oval(*coords['left_cheek'], fill=Config.CHEEK_COLOR, outline="", tags="face_part")
-            self.face_parts['right_cheek'] = self.canvas.create_oval(*coords['right_cheek'], fill=Config.CHEEK_COLOR, outline="", tags="face_part")
+            self.face_parts['mouth'] = self.canvas.create_arc(*coords['mouth'], start=0, extent=-180, style=tk.CHORD, fill=Config.MOUTH_COLOR, outline="", tags=tags)
+            self.face_parts['left_cheek'] = self.canvas.create_oval(*coords['left_cheek'], fill=Config.CHEEK_COLOR, outline="", tags=tags)
+            self.face_parts['right_cheek'] = self.canvas.create_oval(*coords['right_cheek'], fill=Config.CHEEK_COLOR, outline="", tags=tags)
         elif self.current_emotion == 'angry':
-            self.face_parts['mouth'] = self.canvas.create_arc(*coords['mouth'], start=0, extent=180, style=tk.ARC, outline=Config.MOUTH_COLOR, width=6, tags="face_part")
-            self.face_parts['left_eyebrow'] = self.canvas.create_line(*coords['left_eyebrow'], fill=Config.EYEBROW_COLOR, width=8, tags="face_part")
-            self.face_parts['right_eyebrow'] = self.canvas.create_line(*coords['right_eyebrow'], fill=Config.EYEBROW_COLOR, width=8, tags="face_part")
+            self.face_parts['mouth'] = self.canvas.create_arc(*coords['mouth'], start=0, extent=180, style=tk.ARC, outline=Config.MOUTH_COLOR, width=6, tags=tags)
+            self.face_parts['left_eyebrow'] = self.canvas.create_line(*coords['left_eyebrow'], fill=Config.EYEBROW_COLOR, width=8, tags=tags)
+            self.face_parts['right_eyebrow'] = self.canvas.create_line(*coords['right_eyebrow'], fill=Config.EYEBROW_COLOR, width=8, tags=tags)
         elif self.current_emotion == 'scared':
-            self.face_parts['mouth'] = self.canvas.create_oval(*coords['mouth'], fill=Config.MOUTH_COLOR, outline="", tags="face_part")
+            self.face_parts['mouth'] = self.canvas.create_oval(*coords['mouth'], fill=Config.MOUTH_COLOR, outline="", tags=tags)
         else: # Neutral or Confused
-            self.face_parts['mouth'] = self.canvas.create_line(coords['mouth'][0], coords['mouth'][1], coords['mouth'][2], coords['mouth'][1], fill=Config.MOUTH_COLOR, width=6, capstyle=tk.ROUND, tags="face_part")
-        
-        # Store initial coordinates for all created parts for drift-free animation
-        for name, part_id in self.face_parts.items():
-            self.initial_coords[name] = self.canvas.coords(part_id)
+            self.face_parts['mouth'] = self.canvas.create_line(coords['mouth'][0], coords['mouth'][1], coords['mouth'][2], coords['mouth'][1], fill=Config.MOUTH_COLOR, width=6, capstyle=tk.ROUND, tags=tags)
+
+        # Rest coordinates for the transient parts come straight from the
+        # creation arguments above (the neutral mouth is a flat line)
+        for name in self._TRANSIENT_PARTS:
+            if name not in self.face_parts:
+                continue
+            c = coords[name]
+            if name == 'mouth' and self.current_emotion not in ['happy', 'shy', 'angry', 'scared']:
+                self.initial_coords[name] = [c[0], c[1], c[2], c[1]]
+            else:
+                self.initial_coords[name] = list(c)
 
+        # Hoist the per-pupil geometry out of the idle loop: eye radius,
+        # pupil radius and the travel limit only change with the emotion,
+        # yet were recomputed (plus two dict lookups and a str.replace)
+        # for both pupils on every frame
+        self._pupil_max_offset = {}
+        for eye_type in ['left_eye', 'right_eye']:
+            eye_initial = self.initial_coords.get(eye_type)
+            pupil_initial = self.initial_coords.get(f'{eye_type}_pupil')
+            if eye_initial and pupil_initial:
+                eye_radius_x = (eye_initial[2] - eye_initial[0]) / 2
+                pupil_radius_x = (pupil_initial[2] - pupil_initial[0]) / 2
+                self._pupil_max_offset[f'{eye_type}_pupil'] = eye_radius_x - pupil_radius_x - 2
+
+        # Un-hide everything (the game image may have hidden the face),
+        # then let the blink state sort out eye vs lid visibility
+        self.canvas.itemconfig("face_part", state=tk.NORMAL)
         self._set_eyes_open(self.eyes_open, force_redraw=True)
 
     def set_emotion(self, emotion):
         """Sets the current emotion and redraws the face."""
         if emotion != self.current_emotion:
             self.current_emotion = emotion
-            new_bg = Config.EMOTION_COLORS.get(emotion, Config.EMOTION_COLORS['neutral'])
-            self.canvas.config(bg=new_bg)
+            self.canvas.config(bg=_emotion_bg(emotion))
             self.draw_face()
 
     def _set_eyes_open(self, is_open, force_redraw=False):
@@ -206,60 +396,102 @@ class MarichFaceApp:
             return
         self.eyes_open = is_open
         
+        eye_state = tk.NORMAL if is_open else tk.HIDDEN
+        lid_state = tk.HIDDEN if is_open else tk.NORMAL
         for eye_type in ['left_eye', 'right_eye']:
             eye, pupil = self.face_parts.get(eye_type), self.face_parts.get(f'{eye_type}_pupil')
             if not eye or not pupil: continue
-            
-            self.canvas.itemconfig(pupil, state=tk.NORMAL if is_open else tk.HIDDEN)
-            self.canvas.itemconfig(eye, state=tk.NORMAL if is_open else tk.HIDDEN)
-
-            if f'{eye_type}_lid' in self.face_parts:
-                self.canvas.delete(self.face_parts[f'{eye_type}_lid'])
-            
-            if not is_open:
-                coords = self.canvas.coords(eye)
-                y_center = (coords[1] + coords[3]) / 2
-                lid_id = self.canvas.create_line(coords[0], y_center, coords[2], y_center, fill=Config.PUPIL_COLOR, width=6, tags="face_part")
-                self.face_parts[f'{eye_type}_lid'] = lid_id
-                self.initial_coords[f'{eye_type}_lid'] = self.canvas.coords(lid_id)
+
+            # Lids persist from draw_face; a blink is three state flips
+            # with no item churn
+            self.canvas.itemconfig(pupil, state=eye_state)
+            self.canvas.itemconfig(eye, state=eye_state)
+            lid = self.face_parts.get(f'{eye_type}_lid')
+            if lid:
+                self.canvas.itemconfig(lid, state=lid_state)
 
     def start_animation_loops(self):
-        """Starts the idle and talking animation loops."""
-        self._idle_loop()
-        self._animation_loop()
+        """Starts the idle animation loop.
+
+        The talking loop is started on demand by start_talking rather
+        than polling animation_active forever.
+        """
+        if self._idle_after_id is None:
+            self._idle_loop()
 
     def suspend(self):
         """Temporarily hide GUI and stop animations to save CPU."""
         try:
             self.animation_active = False
+            # Cancel pending loop callbacks so nothing ticks while hidden
+            # and resume() can't stack a second chain on a survivor
+            for attr in ('_idle_after_id', '_anim_after_id'):
+                after_id = getattr(self, attr)
+                if after_id is not None:
+                    self.root.after_cancel(after_id)
+                    setattr(self, attr, None)
             self.root.withdraw()
         except Exception:
             pass
 
+    def ensure_canvas(self):
+        """Idempotently rebuild the face if its canvas items are missing.
+
+        Memory cleanup (ai_startup) may have deleted the face items while
+        the window was withdrawn; redraw only when they are actually gone
+        so a normal resume stays cheap.
+        """
+        try:
+            if not self.face_parts or not self.canvas.find_withtag('face_part'):
+                self.draw_face()
+        except Exception:
+            pass
+
     def resume(self):
         """Show GUI again and restart idle loops if needed."""
         try:
             self.root.deiconify()
-            # Restart loops only if not already scheduled
-            self._idle_loop()
-            self._animation_loop()
+            self.ensure_canvas()  # Self-heal if cleanup removed face items
+            # Restart the idle loop only if no callback survived suspend;
+            # the mouth loop rearms via start_talking
+            if self._idle_after_id is None:
+                self._idle_loop()
         except Exception:
             pass
 
+    def _schedule_frame(self, t0, fps, callback):
+        """Schedule the next frame, compensating for this frame's cost.
+
+        A fixed after(delay) drifts under load: the real period becomes
+        delay + draw time, and overrunning frames stack up callbacks on a
+        busy Pi. Subtracting the measured frame time keeps the loop at
+        its target FPS and never schedules faster than 1 ms.
+        """
+        elapsed_ms = (time.perf_counter() - t0) * 1000.0
+        wait_ms = max(1, int(1000.0 / fps - elapsed_ms))
+        return self.root.after(wait_ms, callback)
+
     def _animation_loop(self):
-        """Handles the mouth animation when the chatbot is talking."""
-        if self.animation_active:
-            self._animate_mouth()
-        self.root.after(25, self._animation_loop)
+        """Handles the mouth animation when the chatbot is talking.
+
+        Runs only while animation_active: when talking stops the loop
+        simply doesn't reschedule, so idle costs zero wakeups instead of
+        40 no-op callbacks per second. start_talking rearms it.
+        """
+        t0 = time.perf_counter()
+        if not self.animation_active:
+            self._anim_after_id = None
+            return
+        self._animate_mouth()
+        self._anim_after_id = self._schedule_frame(t0, Config.TALK_FPS, self._animation_loop)
 
     def _animate_mouth(self):
         """Changes the mouth shape based on the current emotion and animation step."""
         mouth_id = self.face_parts.get('mouth')
         if not mouth_id: return
         
-        f = (math.sin(math.pi * self.animation_step / 10) + 1) / 2
-        base_coords = self.base_coords.get(self.current_emotion, self.base_coords['neutral'])
-        base_M = base_coords.get('mouth')
+        f = self._mouth_f[self.animation_step]
+        base_M = self._cached_base_mouth  # Refreshed by draw_face
         if not base_M: return
         
         if self.current_emotion in ['happy', 'shy']:
@@ -281,12 +513,33 @@ class MarichFaceApp:
 
     def _idle_loop(self):
         """Handles all idle animations, including starfield and facial drift."""
+        t0 = time.perf_counter()
+        self._idle_after_id = None  # Our callback fired; safe to reschedule
         # --- Starfield Scrolling ---
-        for star in self.background_stars:
-            self.canvas.move(star, -0.2, -0.1)
-            x1, y1, _, _ = self.canvas.coords(star)
-            if x1 < 0: self.canvas.move(star, Config.CANVAS_WIDTH, 0)
-            if y1 < 0: self.canvas.move(star, 0, Config.CANVAS_HEIGHT)
+        if self._bg_item is not None:
+            # O(1) in Tk traffic: slide the pre-rendered tiled image up
+            # and wrap at one tile height for a seamless loop
+            self._scroll_y = (self._scroll_y + 0.5) % Config.CANVAS_HEIGHT
+            self.canvas.coords(self._bg_item, 0, -self._scroll_y)
+        elif np is not None:
+            # One vectorized drift + wrap for all stars, then a single
+            # coords write per star - no coords reads, no per-star
+            # conditionals, no Python float math
+            self.star_xy[:, 0] -= 0.2
+            self.star_xy[:, 1] -= 0.1
+            np.mod(self.star_xy, self._star_wrap, out=self.star_xy)
+            set_coords = self.canvas.coords
+            for sid, (x, y), s in zip(self.star_ids, self.star_xy, self.star_sizes):
+                set_coords(sid, x, y, x + s, y + s)
+        else:
+            # Positions are tracked Python-side, so no per-star coords
+            # readback (a full Tk round trip each) is needed for the wrap
+            for star, pos in zip(self.background_stars, self._star_pos):
+                pos[0] -= 0.2
+                pos[1] -= 0.1
+                if pos[0] < 0: pos[0] += Config.CANVAS_WIDTH
+                if pos[1] < 0: pos[1] += Config.CANVAS_HEIGHT
+                self.canvas.coords(star, pos[0], pos[1], pos[0] + pos[2], pos[1] + pos[2])
 
         if not self.animation_active:
             # --- Blinking Logic ---
@@ -302,68 +555,149 @@ class MarichFaceApp:
                     self._set_eyes_open(False)
 
             # --- Facial Drift ---
-            bob_y = 1.5 * math.sin(self.idle_step / 10)
-            bob_x = 1.0 * math.cos(self.idle_step / 10)
-            
+            step = self.idle_step
+            bob_y = self._bob_sin[step]
+            bob_x = self._bob_cos[step]
+
+            # Every non-pupil part shares the same whole-pixel bob, so
+            # translate them all with one canvas.move on the "face_part"
+            # tag: Tk's purpose-built fast path for pure translation,
+            # with no per-part coord lists crossing the Tcl boundary.
+            # The drift advances in sub-pixel steps, so on most frames
+            # the quantized delta is zero and nothing is sent at all.
+            qx, qy = round(bob_x), round(bob_y)
+            dx = qx - self._last_bob[0]
+            dy = qy - self._last_bob[1]
+            moved = bool(dx or dy)
+            if moved:
+                self._last_bob = (qx, qy)
+                try:
+                    self.canvas.move("face_part", dx, dy)
+                except tk.TclError:
+                    pass
+
+            # Pupils carry an independent offset on top of the bob, so
+            # they still get absolute coords writes (batched below)
+            pending = []
             for name, part_id in self.face_parts.items():
+                if 'pupil' not in name:
+                    continue
                 initial = self.initial_coords.get(name)
                 if not initial: continue
-
-                if 'pupil' in name:
-                    eye_name = name.replace('_pupil', '')
-                    eye_initial = self.initial_coords.get(eye_name)
-                    if not eye_initial: continue
-                    
-                    eye_radius_x = (eye_initial[2] - eye_initial[0]) / 2
-                    pupil_radius_x = (initial[2] - initial[0]) / 2
-                    max_pupil_offset = eye_radius_x - pupil_radius_x - 2
-
-                    pupil_x_offset = max_pupil_offset * math.sin(self.idle_step / 15)
-                    pupil_y_offset = max_pupil_offset * math.cos(self.idle_step / 20) * 0.7
-
-                    new_coords = [
-                        initial[0] + bob_x + pupil_x_offset, initial[1] + bob_y + pupil_y_offset,
-                        initial[2] + bob_x + pupil_x_offset, initial[3] + bob_y + pupil_y_offset
-                    ]
-                else: # All other parts just bob
-                    new_coords = [c + (bob_x if i % 2 == 0 else bob_y) for i, c in enumerate(initial)]
-
+                max_pupil_offset = self._pupil_max_offset.get(name)
+                if max_pupil_offset is None: continue
+
+                pupil_x_offset = max_pupil_offset * self._pupil_sin[step]
+                pupil_y_offset = max_pupil_offset * self._pupil_cos[step]
+
+                new_q = (
+                    round(initial[0] + bob_x + pupil_x_offset), round(initial[1] + bob_y + pupil_y_offset),
+                    round(initial[2] + bob_x + pupil_x_offset), round(initial[3] + bob_y + pupil_y_offset)
+                )
+                # The tag move above translated the pupils too, so the
+                # skip is only safe on frames where the tag didn't move
+                if not moved and new_q == self._last_applied_coords.get(name):
+                    continue
+                self._last_applied_coords[name] = new_q
+                pending.append('%s coords %d %d %d %d %d' % (self._cw, part_id, *new_q))
+
+            if pending:
+                # One Python-to-Tcl round trip for every part that moved,
+                # instead of one per part: the interp entry/exit dominates
+                # the cost of these tiny commands
                 try:
-                    self.canvas.coords(part_id, *new_coords)
+                    self.canvas.tk.eval('; '.join(pending))
                 except tk.TclError:
-                    # This can happen if a part was deleted mid-animation
+                    # A part was deleted mid-animation; draw_face will
+                    # rebuild items and reset the applied-coords cache
                     pass
-            
-            self.idle_step += 1
 
-        self.root.after(50, self._idle_loop)
+            self.idle_step = (self.idle_step + 1) % 600
+
+        self._idle_after_id = self._schedule_frame(t0, Config.IDLE_FPS, self._idle_loop)
         
     def start_talking(self):
         """Starts the mouth animation."""
         self.animation_active = True
         self.draw_face()
         if not self.eyes_open: self._set_eyes_open(True)
+        if self._anim_after_id is None:
+            self._anim_after_id = self.root.after(1, self._animation_loop)
 
     def stop_talking(self):
         """Stops the mouth animation."""
         self.animation_active = False
+        if self._anim_after_id is not None:
+            try:
+                self.root.after_cancel(self._anim_after_id)
+            except Exception:
+                pass
+            self._anim_after_id = None
         self.draw_face()
 
     # --- NEW: Game Image Methods ---
 
+    def _prewarm_images(self):
+        """Decode and resize the RPS images off the Tk main thread.
+
+        ImageTk.PhotoImage must be built on the Tk thread, but the slow
+        part - PNG decode plus resample - is plain PIL and runs fine
+        here, so the first display_game_image only does the cheap wrap
+        instead of stalling the animation loops on disk I/O.
+        """
+        size = min(Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT) // 2
+        for path in (Config.RPS_ROCK_PATH, Config.RPS_PAPER_PATH, Config.RPS_SCISSORS_PATH):
+            try:
+                img = Image.open(path)
+                if img.size != (size, size):
+                    # BILINEAR, not LANCZOS: ~4x cheaper and visually
+                    # identical for a 150px icon on this low-DPI screen
+                    img = img.resize((size, size), Image.Resampling.BILINEAR)
+                self._raw_cache[path] = img
+            except Exception as e:
+                print(f"Warning: could not pre-load game image {path}: {e}")
+
+    def warm_game_images(self):
+        """Builds the Tk PhotoImages for all three RPS icons ahead of play.
+
+        Must run on the Tk thread (schedule via root.after). The slow PIL
+        decode/resize is normally already done by _prewarm_images; this
+        does the remaining ImageTk wrap so the first display of each icon
+        mid-round is a pure cache hit instead of a stall.
+        """
+        if not _PIL_OK:
+            return
+        size = min(Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT) // 2
+        for path in (Config.RPS_ROCK_PATH, Config.RPS_PAPER_PATH, Config.RPS_SCISSORS_PATH):
+            if path in self.image_cache:
+                continue
+            try:
+                img = self._raw_cache.get(path)
+                if img is None:
+                    img = Image.open(path)
+                    if img.size != (size, size):
+                        img = img.resize((size, size), Image.Resampling.BILINEAR)
+                self.image_cache[path] = ImageTk.PhotoImage(img)
+            except Exception as e:
+                print(f"Warning: could not warm game image {path}: {e}")
+
     def display_game_image(self, image_path: str):
         """Displays a specific image (Rock/Paper/Scissors) on the canvas."""
         if image_path not in self.image_cache:
             try:
-                img = Image.open(image_path)
-                # --- FIX: Check if image loaded before resizing ---
+                # Usually already decoded and resized by _prewarm_images
+                img = self._raw_cache.get(image_path)
                 if img is None:
-                    print(f"Error: Could not load image {image_path}. Is PIL installed?")
-                    self.current_game_image = None
-                    return
-                # --- END FIX ---
-                size = min(Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT) // 2
-                img = img.resize((size, size), Image.Resampling.LANCZOS)
+                    img = Image.open(image_path)
+                    # --- FIX: Check if image loaded before resizing ---
+                    if img is None:
+                        print(f"Error: Could not load image {image_path}. Is PIL installed?")
+                        self.current_game_image = None
+                        return
+                    # --- END FIX ---
+                    size = min(Config.CANVAS_WIDTH, Config.CANVAS_HEIGHT) // 2
+                    if img.size != (size, size):
+                        img = img.resize((size, size), Image.Resampling.BILINEAR)
                 self.image_cache[image_path] = ImageTk.PhotoImage(img)
             except Exception as e:
                 print(f"Error loading game image {image_path}: {e}")
@@ -400,9 +734,28 @@ class MarichFaceApp:
 
     def _handle_pat(self, event):
         """Handles a drag/slide motion on the screen, debounced to prevent spam."""
-        current_time = time.time()
-        # Trigger pat callback if touch is enabled, a callback is set,
-        # and it's been at least 1 second since the last pat.
-        if self.touch_enabled and self.pat_callback and (current_time - self.last_pat_time > 1.0):
-            self.last_pat_time = current_time
+        # B1-Motion fires for every touch sample during a drag - bail out
+        # before any time handling when a pat can't have an effect
+        if not self.touch_enabled or self.pat_callback is None:
+            return
+        # Coalesce: a touchscreen drag delivers 100+ samples/s, but at
+        # most one drain runs per 50 ms window - every further sample in
+        # the window costs just this flag test
+        if self._pat_pending:
+            self._last_pat_event_ms = event.time
+            return
+        self._pat_pending = True
+        self._last_pat_event_ms = event.time
+        self.root.after(50, self._drain_pat)
+
+    def _drain_pat(self):
+        """Deferred pat handler; applies the 1 s debounce once per window."""
+        self._pat_pending = False
+        if not self.touch_enabled or self.pat_callback is None:
+            return
+        # Debounce on event.time, the millisecond timestamp the X server
+        # already delivered with the event - no clock_gettime syscall per
+        # motion event. Trigger at most once per second.
+        if self._last_pat_event_ms - self._last_pat_ms > 1000:
+            self._last_pat_ms = self._last_pat_event_ms
             self.pat_callback()
\ No newline at end of file
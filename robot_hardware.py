@@ -3,10 +3,18 @@
 # This file contains the functions for controlling the robot's motors and LEDs,
 # directly importing from the existing hardware libraries.
 
+import os
 import time
 import threading
+import queue
+import functools
 import random # NEW: Added for the win_led_sequence color selection
 
+# Per-write LED logging is opt-in: print takes the GIL and can block on
+# a slow console, which matters on paths hit for every emotion change
+# and movement command. Rare one-shot events still print unconditionally.
+_LED_DEBUG = os.environ.get("MARICH_LED_DEBUG", "0") == "1"
+
 try:
     # Attempt to import hardware libraries
     from McLumk_Wheel_Sports import (
@@ -50,8 +58,60 @@ EMOTION_LED_MAP = {
 }
 MOVEMENT_LED_COLOR = 3 # Yellow
 
+# --- NEW: Hardware worker queue ---
+# Beep and LED writes are short blocking I2C transactions. Callers (the IR
+# handler, the chatbot thread) push them onto this queue and return
+# immediately; a single daemon worker drains it so the callers never
+# serialize on I2C latency.
+_HW_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+
+def _hw_worker():
+    while True:
+        job = _HW_QUEUE.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"Hardware worker error: {e}")
+
+threading.Thread(target=_hw_worker, daemon=True, name="RobotHWWorker").start()
+
+# Timed light shows (win/lose/scared) sleep for their whole 1.5-2s
+# duration, so they get a worker of their own: parked on _HW_QUEUE they
+# would hold up every queued beep and emotion write behind them.
+_FX_QUEUE: "queue.SimpleQueue" = queue.SimpleQueue()
+
+def _fx_worker():
+    while True:
+        job = _FX_QUEUE.get()
+        try:
+            job()
+        except Exception as e:
+            print(f"LED effects worker error: {e}")
+
+threading.Thread(target=_fx_worker, daemon=True, name="RobotFXWorker").start()
+# --- END NEW ---
+
+# Last (on, color) actually written to the LED bar. The strip keeps its
+# state, so re-sending the same value is a wasted I2C transaction that
+# only contends with motor and sensor traffic.
+_last_led_state = None
+
+def _led_set(on, color):
+    """Write the LED bar state, skipping the write when unchanged."""
+    global _last_led_state
+    if (on, color) == _last_led_state:
+        return
+    _last_led_state = (on, color)
+    bot.Ctrl_WQ2812_ALL(on, color)
+
+# Coalescing flag: rapid taps would otherwise pile beep jobs onto the
+# queue faster than the 50ms beep drains them, delaying LED jobs too
+_beep_pending = False
+
 def _do_beep():
     """Private function to handle the actual beeping sequence."""
+    global _beep_pending
+    _beep_pending = False
     if bot:
         bot.Ctrl_BEEP_Switch(1)  # Buzzer on
         time.sleep(0.05)         # Beep for 50 milliseconds
@@ -60,35 +120,45 @@ def _do_beep():
         print("Sim: Beep!")
 
 def trigger_beep():
-    """Activates the buzzer in a non-blocking thread."""
-    beep_thread = threading.Thread(target=_do_beep)
-    beep_thread.start()
+    """Activates the buzzer without blocking the caller."""
+    global _beep_pending
+    if _beep_pending:
+        return  # A beep is already queued; back-to-back taps coalesce
+    _beep_pending = True
+    _HW_QUEUE.put(_do_beep)
 
 # --- LED Control Functions ---
 
-def set_emotion_led(emotion: str):
-    """Sets the LED bar color based on the robot's emotion."""
+def _set_emotion_led_impl(emotion: str):
+    """Worker-side implementation of the emotion LED write."""
     if bot:
         # Use the original EMOTION_LED_MAP
         color_index = EMOTION_LED_MAP.get(emotion, EMOTION_LED_MAP['neutral'])
-        bot.Ctrl_WQ2812_ALL(1, color_index)
-        print(f"LEDs set to emotion: {emotion} (Color index: {color_index})")
+        _led_set(1, color_index)
+        if _LED_DEBUG:
+            print(f"LEDs set to emotion: {emotion} (Color index: {color_index})")
     else:
         print(f"Sim: LEDs set to emotion: {emotion}")
 
+def set_emotion_led(emotion: str):
+    """Sets the LED bar color based on the robot's emotion (non-blocking)."""
+    _HW_QUEUE.put(functools.partial(_set_emotion_led_impl, emotion))
+
 def set_movement_led():
     """Sets the LED bar to the movement color."""
     if bot:
-        bot.Ctrl_WQ2812_ALL(1, MOVEMENT_LED_COLOR)
-        print("LEDs set to movement color.")
+        _led_set(1, MOVEMENT_LED_COLOR)
+        if _LED_DEBUG:
+            print("LEDs set to movement color.")
     else:
         print("Sim: LEDs set to movement color.")
 
 def turn_off_led():
     """Turns off all LEDs on the bar."""
     if bot:
-        bot.Ctrl_WQ2812_ALL(0, 0)
-        print("LEDs turned off.")
+        _led_set(0, 0)
+        if _LED_DEBUG:
+            print("LEDs turned off.")
     else:
         print("Sim: LEDs turned off.")
 
@@ -124,19 +194,19 @@ def dance_routine():
     delay = 0.4
 
     # Sequence of moves with changing light colors
-    bot.Ctrl_WQ2812_ALL(1, 4) # Purple
+    _led_set(1, 4) # Purple
     rotate_left(speed)
     time.sleep(delay)
     
-    bot.Ctrl_WQ2812_ALL(1, 5) # Cyan
+    _led_set(1, 5) # Cyan
     rotate_right(speed)
     time.sleep(delay)
     
-    bot.Ctrl_WQ2812_ALL(1, 3) # Yellow
+    _led_set(1, 3) # Yellow
     move_right(speed)
     time.sleep(delay)
     
-    bot.Ctrl_WQ2812_ALL(1, 1) # Green
+    _led_set(1, 1) # Green
     move_left(speed)
     time.sleep(delay)
 
@@ -171,8 +241,13 @@ def angry_movement():
     stop()
     print("Angry movement complete.")
 
-def win_led_sequence(duration=1.5):
-    """Flashes many colors quickly to simulate a win celebration (Marich won in RPS)."""
+# The timed LED sequences below only ever sleep on the effects worker:
+# the public functions enqueue and return immediately, so a call from
+# the Tk thread (or anywhere else) can never freeze the face animation
+# for the duration of a light show - and beeps and emotion writes on
+# the main hardware worker keep flowing while one plays.
+
+def _win_led_impl(duration):
     print("Starting win LED sequence.")
     if not bot:
         print("Sim: Win LED sequence.")
@@ -182,29 +257,43 @@ def win_led_sequence(duration=1.5):
     # Color codes from your original mapping: Red:0, Green:1, Blue:2, Yellow:3, Purple:4, Cyan:5, White:6
     colors = [1, 2, 3, 4, 5, 6] # Exclude red, favoring brighter celebration colors
     while time.time() - start_time < duration:
-        color_code = random.choice(colors)
-        bot.Ctrl_WQ2812_ALL(1, color_code)
+        # Never repeat the current color: _led_set would skip the write
+        # and the flash would visibly stall for a tick
+        color_code = random.choice([c for c in colors if (1, c) != _last_led_state])
+        _led_set(1, color_code)
         time.sleep(0.1) # Fast flash
-    
+
     turn_off_led()
     print("Win LED sequence complete.")
 
-def lose_led_sequence(duration=1.5):
-    """Solid red to simulate anger/losing (Marich lost in RPS)."""
+def win_led_sequence(duration=1.5):
+    """Flashes many colors quickly to simulate a win celebration (Marich won in RPS).
+
+    Non-blocking: the flashing runs on the effects worker.
+    """
+    _FX_QUEUE.put(functools.partial(_win_led_impl, duration))
+
+def _lose_led_impl(duration):
     print("Starting lose LED sequence (Red).")
     if not bot:
         print("Sim: Lose LED sequence (Red).")
         return
 
     # Red is color code 0 in your original EMOTION_LED_MAP
-    bot.Ctrl_WQ2812_ALL(1, 0)
+    _led_set(1, 0)
     time.sleep(duration)
     turn_off_led()
     print("Lose LED sequence complete.")
 
+def lose_led_sequence(duration=1.5):
+    """Solid red to simulate anger/losing (Marich lost in RPS).
 
-def scared_led_sequence(duration=2.0):
-    """Flashes red to simulate fear/warning."""
+    Non-blocking: the hold-and-clear runs on the effects worker.
+    """
+    _FX_QUEUE.put(functools.partial(_lose_led_impl, duration))
+
+
+def _scared_led_impl(duration):
     print("Starting scared LED sequence (Flashing Red).")
     if not bot:
         print("Sim: Scared LED sequence (Flashing Red).")
@@ -213,10 +302,17 @@ def scared_led_sequence(duration=2.0):
     start_time = time.time()
     # Red is color code 0
     while time.time() - start_time < duration:
-        bot.Ctrl_WQ2812_ALL(1, 0) # Red
+        _led_set(1, 0) # Red
         time.sleep(0.15)
-        bot.Ctrl_WQ2812_ALL(0, 0) # Off
+        _led_set(0, 0) # Off
         time.sleep(0.1)
 
     turn_off_led() # Ensure lights are off after
-    print("Scared LED sequence complete.")
\ No newline at end of file
+    print("Scared LED sequence complete.")
+
+def scared_led_sequence(duration=2.0):
+    """Flashes red to simulate fear/warning.
+
+    Non-blocking: the flashing runs on the effects worker.
+    """
+    _FX_QUEUE.put(functools.partial(_scared_led_impl, duration))
\ No newline at end of file
@@ -2,9 +2,21 @@
 #
 # Contains the logic for the Rock, Paper, Scissors game mode.
 
+import collections
+import os
+import sys
 import threading
 import time
 import random
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+import stop_registry
+
+# Per-round progress prints are opt-in: print does sync I/O to stdout
+# (1-3ms each over SSH) and the capture loop can hit its error path at
+# 10Hz on a flaky camera. One-shot events still print unconditionally.
+_RPS_DEBUG = os.environ.get("MARICH_RPS_DEBUG", "0") == "1"
 # import cv2 # REMOVED: No longer needed, CameraMaster handles CV
 # import numpy as np # REMOVED: No longer needed
 
@@ -26,49 +38,72 @@ GAME_OPTIONS = {
     PAPER: {"name": "Paper", "image": Config.RPS_PAPER_PATH},
     SCISSORS: {"name": "Scissors", "image": Config.RPS_SCISSORS_PATH}
 }
+# Picking Marich's move from GAME_OPTIONS.keys() would rebuild a list
+# every round; random.choice works on a tuple directly
+_CHOICES = (ROCK, PAPER, SCISSORS)
+
+# Library gesture name ("Zero" is a fist, "Five" an open hand, ...) to
+# game move. One hash lookup per detection instead of up to six string
+# compares in the old if/elif chain.
+_GESTURE_MAP = {
+    "Zero": ROCK, "One": ROCK,
+    "Two": SCISSORS, "Three": SCISSORS,
+    "Four": PAPER, "Five": PAPER,
+}
+# Intern the gesture names once so the dict lookups and "none" compares
+# in the capture loop can short-circuit on pointer equality when the
+# camera hands back the same interned strings
+for _s in ("Zero", "One", "Two", "Three", "Four", "Five", "none"):
+    sys.intern(_s)
+del _s
+
+# Reused worker pool for the blocking reaction routines (dance, angry
+# movement). Spawning a fresh Thread object per round costs a few ms on
+# the Pi and churns memory; two pooled workers cover every round.
+_FX_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rps-fx")
 
 # --- TTS Lines ---
-START_LINES = [
+START_LINES = (
     "Challenge accepted! Let's play rock paper scissors!",
     "Ready to lose to a machine? Let the battle begin!",
     "I hope you brought your best strategy. First match starts now."
-]
+)
 
-SHOOT_PHRASES = [
+SHOOT_PHRASES = (
     "Rock, Paper, Scissors, shoot!",
     "On the count of three... Rock, Paper, Scissors, go!",
     "Ready? Rock, Paper, Scissors, now!"
-]
+)
 
-WIN_LINES = [
+WIN_LINES = (
     "Yes! I win again! Victory is mine!",
     "Beep boop, my programming prevails! Better luck next time, human.",
     "Another flawless victory for the Marich operating system!"
-]
+)
 
-LOSE_LINES = [
+LOSE_LINES = (
     "What?! I mean, you won! Ah, frustration!",
     "A temporary setback. I let you win that one, I promise.",
     "Curse this fleshy adversary! You got lucky, I'll admit it."
-]
+)
 
-DRAW_LINES = [
+DRAW_LINES = (
     "A draw! Great minds think alike, but next time I'll crush you!",
     "Stalemate! Let's try to break the deadlock.",
     "We tied! Time for a rematch."
-]
+)
 
-NEXT_MATCH_LINES = [
+NEXT_MATCH_LINES = (
     "Again! I'll win next time!",
     "One more round, I need to redeem myself.",
     "Your luck won't last. Let's go again."
-]
+)
 
-END_LINES = [
+END_LINES = (
     "Thanks for the game! I enjoyed our battle of wits... and hands.",
     "Game over. Come back when you're ready for a rematch!",
     "Exiting game mode. See you next time!"
-]
+)
 
 
 # --- Camera / Finger Counting Logic ---
@@ -77,17 +112,22 @@ END_LINES = [
 
 # --- Game Logic ---
 
+def _post_round_ui(app, emotion: str):
+    """Applies the end-of-round UI reset in a single Tk callback.
+
+    Scheduling clear_game_image and set_emotion separately posts two
+    events and wakes the Tk main loop twice; one callback does both.
+    """
+    app.clear_game_image()
+    app.set_emotion(emotion)
+
+
 def determine_winner(player_move: int, marich_move: int) -> str:
     """Determines the winner ('win', 'lose', 'draw')."""
-    if player_move == marich_move:
-        return 'draw'
-    # Player Wins: (P vs R) or (R vs S) or (S vs P)
-    if (player_move == PAPER and marich_move == ROCK) or \
-            (player_move == ROCK and marich_move == SCISSORS) or \
-            (player_move == SCISSORS and marich_move == PAPER):
-        return 'win'  # Marich loses
-    # Marich Wins: (R vs P) or (S vs R) or (P vs S)
-    return 'lose'  # Marich wins
+    # ROCK=0, PAPER=1, SCISSORS=2 form a cycle where each move beats the
+    # one below it, so (player - marich) mod 3 is 0 on a draw, 1 when the
+    # player wins and 2 when Marich wins - no branches at all.
+    return ('draw', 'win', 'lose')[(player_move - marich_move) % 3]
 
 
 # --- Main Game Thread Function ---
@@ -99,31 +139,63 @@ def run_rps_game(app: MarichFaceApp, camera: CameraMaster, stop_event: threading
     """
 
     # 1. Initialization
+    # Register our stopper so big_main can stop us without importing us
+    stop_registry.register("rps", stop_event.set)
+
+    # Local bindings for names hit every round: LOAD_FAST instead of a
+    # global (or attribute chain) lookup on each use
+    _choice = random.choice
+    _speak = speak_and_animate
+    _after = app.root.after
     motor_stop()
     turn_off_led()
 
+    # Build the Tk PhotoImages for all three icons now, during the intro
+    # line, so no round pays the decode/wrap cost when a move is shown
+    _after(0, app.warm_game_images)
+
+    # Optional: raise the game thread's scheduling class to cut jitter in
+    # gesture-to-reaction latency under load. SCHED_RR needs CAP_SYS_NICE,
+    # so this is opt-in via environment variable like the LED debug flag.
+    if os.environ.get("MARICH_RT_PRIORITY", "0") == "1":
+        try:
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(10))
+            print("[RPS] Game thread running with SCHED_RR priority 10.")
+        except (AttributeError, PermissionError, OSError) as e:
+            print(f"[RPS] Could not raise game thread priority: {e}")
+        # Camera builds that expose a priority hook get the same boost
+        # for the inference worker
+        set_priority = getattr(camera, "set_priority", None)
+        if set_priority is not None:
+            try:
+                set_priority(10)
+            except Exception as e:
+                print(f"[RPS] Could not raise camera thread priority: {e}")
+
     # --- FIX: Thread-Safety ---
     # All UI operations MUST be scheduled on the main thread using app.root.after
-    app.root.after(0, lambda: app.set_emotion('happy'))
+    _after(0, app.set_emotion, 'happy')
     # --- END FIX ---
 
     # Start the game
     # We assume speak_and_animate is thread-safe (handles its own root.after calls)
     # since the chatbot thread also uses it.
-    speak_and_animate(app, random.choice(START_LINES), 'neutral')
+    _speak(app, _choice(START_LINES), 'neutral')
 
-    time.sleep(1.0)  # Pause after intro
+    # Event.wait sleeps like time.sleep but wakes the instant a stop is
+    # requested, so quitting the game no longer waits out the pause
+    stop_event.wait(1.0)  # Pause after intro
 
     while not stop_event.is_set():
         # A. Marich makes a choice
-        marich_choice = random.choice(list(GAME_OPTIONS.keys()))
+        marich_choice = _choice(_CHOICES)
         marich_move_name = GAME_OPTIONS[marich_choice]["name"]
         marich_image_path = GAME_OPTIONS[marich_choice]["image"]
 
-        print(f"[RPS] Marich chose: {marich_move_name}")
+        if _RPS_DEBUG: print(f"[RPS] Marich chose: {marich_move_name}")
 
         # B. Start the countdown and capture phase
-        speak_and_animate(app, random.choice(SHOOT_PHRASES), 'neutral')
+        _speak(app, _choice(SHOOT_PHRASES), 'neutral')
 
         # Give a small window for the user to make their move
         time.sleep(0.3)
@@ -132,68 +204,163 @@ def run_rps_game(app: MarichFaceApp, camera: CameraMaster, stop_event: threading
         # C. Capture the player's move
         player_move_result = None
 
-        print("[RPS] Listening for player's gesture...")
-        start_capture_time = time.time()
+        if _RPS_DEBUG: print("[RPS] Listening for player's gesture...")
+        # Monotonic deadline: immune to NTP clock steps, and computed
+        # once so the loop condition is a single comparison
         capture_duration = 2.0  # Listen for 2 seconds
+        capture_deadline = time.monotonic() + capture_duration
 
         gesture_name = "none"
-        while time.time() - start_capture_time < capture_duration:
-            if stop_event.is_set(): break
+
+        # --- NEW: Event-driven capture when the camera supports it ---
+        # If CameraMaster exposes register_gesture_listener (MediaPipe
+        # LIVE_STREAM builds), the camera pushes each new detection to us
+        # and this thread sleeps in queue.get() instead of re-calling
+        # get_gesture_detection() at 20Hz for two seconds. Older builds
+        # without the hook fall back to the polling loop below.
+        register_listener = getattr(camera, "register_gesture_listener", None)
+        unregister_listener = getattr(camera, "unregister_gesture_listener", None)
+        # Condition notified by the camera's result callback on each new
+        # detection; lets the polling fallback wait for fresh data
+        # instead of sleeping a fixed 50ms between fetches
+        gesture_cv = getattr(camera, "_gesture_cv", None)
+        # Non-blocking cached read: returns the camera thread's latest
+        # (frame_id, gesture, confidence) tuple without running inference,
+        # so polling it is nearly free and can spin at 10ms
+        get_latest = getattr(camera, "get_latest_gesture", None)
+        gesture_q = None
+        if register_listener is not None:
+            gesture_q = queue.Queue(maxsize=1)
+
+            def _on_gesture(result, _q=gesture_q):
+                try:
+                    _q.put_nowait(result)
+                except queue.Full:
+                    pass  # Consumer hasn't caught up; drop the stale frame
 
             try:
-                # --- FIX: Call the correct method get_gesture_detection()
-                # ---      and access the .gesture attribute from the result.
-                detection_result = camera.get_gesture_detection()
-                
+                register_listener(_on_gesture)
+            except Exception as e:
+                print(f"[RPS] Could not register gesture listener: {e}")
+                gesture_q = None
+        # --- END NEW ---
+
+        # Rolling window of the last few mapped moves. Accepting the
+        # very first non-"none" frame was noisy under motion blur; a
+        # move now needs a majority of the window (and a confident
+        # detection, when the camera reports confidence) to commit.
+        recent = collections.deque(maxlen=5)
+        camera_error_printed = False
+        last_frame_id = None
+
+        try:
+            while time.monotonic() < capture_deadline:
+                if stop_event.is_set(): break
+
+                confidence = None
+                if gesture_q is not None:
+                    # Block until the camera delivers a detection, capped
+                    # so stop requests and the 2s deadline stay responsive.
+                    # Re-check the deadline here: it can pass between the
+                    # loop condition and this read, and Queue.get raises
+                    # ValueError on a negative timeout.
+                    remaining = capture_deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        detection_result = gesture_q.get(timeout=min(remaining, 0.25))
+                    except queue.Empty:
+                        continue
+                elif get_latest is not None:
+                    latest = get_latest()
+                    if not latest or latest[0] == last_frame_id:
+                        # No detection yet, or the same frame we already
+                        # consumed: don't let one frame fill the window
+                        time.sleep(0.01)
+                        continue
+                    last_frame_id = latest[0]
+                    gesture_name = latest[1] or "none"
+                    confidence = latest[2] if len(latest) > 2 else None
+                    detection_result = None
+                else:
+                    try:
+                        # --- FIX: Call the correct method get_gesture_detection()
+                        # ---      and access the .gesture attribute from the result.
+                        detection_result = camera.get_gesture_detection()
+                    except AttributeError:
+                        print("[RPS] FATAL ERROR: 'CameraMaster' object has no attribute 'get_gesture_detection'.")
+                        print("[RPS] This indicates a mismatch between rock_paper_scissors.py and camera_master_lib.py.")
+                        # As a fallback, just pick a random move for the player to avoid a crash
+                        player_move_result = _choice(_CHOICES)
+                        break  # Exit loop
+                    except Exception as e:
+                        # Report a broken camera once per capture window;
+                        # at 10Hz the repeated print would dominate the loop
+                        if _RPS_DEBUG or not camera_error_printed:
+                            print(f"[RPS] Error calling get_gesture_detection: {e}")
+                            camera_error_printed = True
+                        time.sleep(0.1)
+                        continue
+
                 if detection_result:
                     gesture_name = detection_result.gesture
-                else:
+                    confidence = getattr(detection_result, "confidence", None)
+                elif gesture_q is not None or get_latest is None:
                     gesture_name = "none" # No hand detected
-                
-            except AttributeError:
-                print("[RPS] FATAL ERROR: 'CameraMaster' object has no attribute 'get_gesture_detection'.")
-                print("[RPS] This indicates a mismatch between rock_paper_scissors.py and camera_master_lib.py.")
-                # As a fallback, just pick a random move for the player to avoid a crash
-                player_move_result = random.choice([ROCK, PAPER, SCISSORS])
-                break  # Exit loop
-            except Exception as e:
-                print(f"[RPS] Error calling get_gesture_detection: {e}")
-                time.sleep(0.1)
-                continue
-
-            # --- FIX: Translate gesture names from the library ("Zero", "Two", "Five")
-            # ---      to the game logic ("rock", "paper", "scissors")
-
-            if gesture_name == "Zero" or gesture_name == "One":      # "Zero" is a fist (Rock)
-                player_move_result = ROCK
-                break
-            elif gesture_name == "Five" or gesture_name == "Four":    # "Five" is an open hand (Paper)
-                player_move_result = PAPER
-                break
-            elif gesture_name == "Two" or gesture_name == "Three":     # "Two" is two fingers (Scissors)
-                player_move_result = SCISSORS
-                break   
-            # --- END OF FIX ---
-
-            # If gesture is "none" or unrecognized, keep looping
-            time.sleep(0.05)  # Poll quickly
+
+                # --- FIX: Translate gesture names from the library ("Zero", "Two", "Five")
+                # ---      to the game logic ("rock", "paper", "scissors")
+                mv = _GESTURE_MAP.get(gesture_name)
+                if gesture_name == "none":
+                    # Hand left the frame: drop the accumulated window so
+                    # a re-entering hand starts from a clean vote
+                    recent.clear()
+                else:
+                    recent.append(mv)
+                if mv is not None and recent.count(mv) >= 3:
+                    # Camera builds that report a confidence score also
+                    # gate on it; older ones accept the window majority
+                    if confidence is None or confidence >= 0.98:
+                        player_move_result = mv
+                        break
+                # --- END OF FIX ---
+
+                # If gesture is "none" or unrecognized, keep looping.
+                # (The cached-read path paces itself with its 10ms sleep
+                # on the same-frame check above.)
+                if gesture_q is None and get_latest is None:
+                    if gesture_cv is not None:
+                        # Sleep exactly until the next detection lands
+                        # (or the deadline), not a fixed poll interval
+                        remaining = capture_deadline - time.monotonic()
+                        if remaining > 0:
+                            with gesture_cv:
+                                gesture_cv.wait(timeout=min(remaining, 0.25))
+                    else:
+                        time.sleep(0.05)  # Poll quickly
+        finally:
+            if gesture_q is not None and unregister_listener is not None:
+                try:
+                    unregister_listener(_on_gesture)
+                except Exception:
+                    pass
 
         if player_move_result is not None:
             player_move_name = GAME_OPTIONS[player_move_result]["name"]
-            print(f"[RPS] Player detected move: {player_move_name}")
+            if _RPS_DEBUG: print(f"[RPS] Player detected move: {player_move_name}")
         else:
-            print("[RPS] No clear move detected.")
+            if _RPS_DEBUG: print("[RPS] No clear move detected.")
             # This call is already correctly wrapped in your original file
-            app.root.after(0, lambda: app.set_emotion('confused'))
+            _after(0, app.set_emotion, 'confused')
 
         # --- END OF MODIFIED BLOCK ---
 
         # D. Display Marich's move and determine the winner
         # This call is already correctly wrapped
-        app.root.after(0, lambda p=marich_image_path: app.display_game_image(p))
+        _after(0, app.display_game_image, marich_image_path)
 
         # Short pause to let the user see the move and image appear
-        time.sleep(1.0)
+        if stop_event.wait(1.0): break
 
         if player_move_result is None:
             # If no clear move was detected after all attempts
@@ -202,50 +369,53 @@ def run_rps_game(app: MarichFaceApp, camera: CameraMaster, stop_event: threading
 
         else:
             result = determine_winner(player_move_result, marich_choice)
-            print(f"[RPS] Result: Marich {result}s.")
+            if _RPS_DEBUG: print(f"[RPS] Result: Marich {result}s.")
 
             # E. Marich's Reaction (TTS, Face, Hardware)
             if result == 'lose':
                 # Marich WINS
-                result_line = random.choice(WIN_LINES)
-                app.root.after(0, lambda: app.set_emotion('happy'))
-                threading.Thread(target=dance_routine, daemon=True).start()
-                threading.Thread(target=win_led_sequence, daemon=True).start()
+                result_line = _choice(WIN_LINES)
+                _after(0, app.set_emotion, 'happy')
+                _FX_POOL.submit(dance_routine)
+                # The LED sequences run on the hardware worker queue and
+                # return immediately, so no thread is needed for them
+                win_led_sequence()
 
             elif result == 'win':
                 # Marich LOSES
-                result_line = random.choice(LOSE_LINES)
-                app.root.after(0, lambda: app.set_emotion('angry'))
-                threading.Thread(target=angry_movement, daemon=True).start()
-                threading.Thread(target=lose_led_sequence, daemon=True).start()
+                result_line = _choice(LOSE_LINES)
+                _after(0, app.set_emotion, 'angry')
+                _FX_POOL.submit(angry_movement)
+                lose_led_sequence()
 
             else:  # Draw
-                result_line = random.choice(DRAW_LINES)
-                app.root.after(0, lambda: app.set_emotion('neutral'))
+                result_line = _choice(DRAW_LINES)
+                _after(0, app.set_emotion, 'neutral')
                 # No movement for draw
 
         # Say the reaction line
-        speak_and_animate(app, result_line, app.current_emotion)
+        _speak(app, result_line, app.current_emotion)
 
-        # F. Pause and cleanup before next match
-        time.sleep(2.0)
+        # F. Pause and cleanup before next match (wakes early on stop;
+        # the cleanup below runs either way)
+        stop_event.wait(2.0)
 
-        app.root.after(0, app.clear_game_image)
+        _after(0, _post_round_ui, app, 'neutral')
         motor_stop()  # Stop any lingering movement
         turn_off_led()
-        app.root.after(0, lambda: app.set_emotion('neutral'))
 
         if not stop_event.is_set():
             # Say next match line and wait before the next loop iteration
-            speak_and_animate(app, random.choice(NEXT_MATCH_LINES), 'neutral')
-            time.sleep(1.0)
+            _speak(app, _choice(NEXT_MATCH_LINES), 'neutral')
+            stop_event.wait(1.0)
 
     # 2. Cleanup / Exit
-    end_line = random.choice(END_LINES)
-    speak_and_animate(app, end_line, 'neutral')
-    app.root.after(0, app.clear_game_image)
+    end_line = _choice(END_LINES)
+    _speak(app, end_line, 'neutral')
+    _after(0, app.clear_game_image)
     turn_off_led()
     motor_stop()
+    stop_registry.unregister("rps")
     print("[RPS] Rock Paper Scissors game thread exiting.")
 
 
@@ -0,0 +1,34 @@
+# stop_registry.py
+#
+# Tiny registry mapping mode names ('chatbot', 'rps', ...) to a stop
+# callable. Each mode registers its stopper when it actually starts, so
+# big_main.py never needs to import a heavy module just to bind its
+# request_stop symbol.
+
+_STOPPERS: dict = {}
+
+
+def register(name: str, fn):
+    """Register (or replace) the stop callable for a mode."""
+    _STOPPERS[name] = fn
+
+
+def unregister(name: str):
+    """Remove a mode's stopper once it has fully stopped."""
+    _STOPPERS.pop(name, None)
+
+
+def stop(name: str):
+    """Invoke a single mode's registered stopper, if any."""
+    fn = _STOPPERS.get(name)
+    if fn:
+        fn()
+
+
+def stop_all():
+    """Invoke every registered stopper (big_main's stop broadcast)."""
+    for fn in list(_STOPPERS.values()):
+        try:
+            fn()
+        except Exception:
+            pass